@@ -4,18 +4,26 @@
 import asyncio
 import re
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.utils import get_column_letter
 from playwright.async_api import async_playwright
-import os
-import requests
+import random
 from dotenv import load_dotenv
 import json
+import logging
+import csv
 import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import httpx
+import html
 from urllib.parse import urljoin, urlparse, unquote
-import hashlib
 from typing import Dict, List, Set, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Load environment variables
 load_dotenv()
@@ -24,33 +32,100 @@ if not GEMINI_API_KEY:
     raise ValueError("GEMINI_API_KEY not found in environment variables.")
 
 OUTPUT_FILE = 'google_maps_businesses.xlsx'
+CSV_OUTPUT_FILE = 'google_maps_businesses.csv'  # Rows are appended here as soon as each business is complete
+LOG_FILE = 'scrape.log'
 SEARCH_URL = 'https://www.google.com/maps'
 GEMINI_MODEL = 'models/gemini-2.0-flash'
 GEMINI_API_URL = f"https://generativelanguage.googleapis.com/v1beta/{GEMINI_MODEL}:generateContent?key={GEMINI_API_KEY}"
 MAX_BUSINESSES = 500  # Increased maximum number of businesses
+GEMINI_MAX_CONCURRENCY = 10  # Simultaneous Gemini requests per scrape run
+CARD_WORKER_PAGES = 4  # Business detail pages extracted concurrently
+GEMINI_BATCH_SIZE = CARD_WORKER_PAGES  # Cards sent to Gemini in one request
+GEMINI_BATCH_WAIT = 0.3  # Seconds a partial batch waits for more cards before it is sent
+WEBSITE_CRAWL_CONCURRENCY = 8  # Business websites crawled concurrently
+WEBSITE_SKIP_MIN_SOCIALS = 4  # Skip the website crawl when Google Maps has an email and this many social links
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Per-card and per-website progress goes through logging, noisy details only at DEBUG level
+logger = logging.getLogger(__name__)
+
+# Requests aborted in the Google Maps browser, nothing we extract needs them
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+BLOCKED_TRACKER_HOSTS = ('doubleclick.net', 'googletagmanager.com', 'googlesyndication.com', 'google-analytics.com')
+
+# Scroll helpers for the Google Maps results panel, installed once per page so each
+# scroll step only sends a short function call over CDP
+MAPS_SCROLL_HELPERS_JS = '''
+(() => {
+    const resultsPanel = () => document.querySelector('div[role="main"] div[aria-label][tabindex="0"]');
+    // Jumping straight to the bottom is enough for Maps to fetch the next results
+    window.__scrollResultsToEnd = () => {
+        const scrollable = resultsPanel();
+        if (scrollable) {
+            scrollable.scrollTop = scrollable.scrollHeight;
+        } else {
+            window.scrollTo(0, document.body.scrollHeight);
+        }
+    };
+    window.__aggressiveScroll = () => {
+        const mainContainer = resultsPanel();
+        if (mainContainer) {
+            mainContainer.scrollBy(0, 3000);
+        }
+        window.scrollBy(0, 2000);
+    };
+})()
+'''
+
+# Exported columns, in presentation order
+SOCIAL_PLATFORMS = ('Facebook', 'Instagram', 'Twitter', 'LinkedIn', 'YouTube', 'TikTok', 'Yelp', 'WhatsApp', 'Pinterest')
+COLUMN_ORDER = (
+    'Business Name', 'Business Type', 'Address', 'Phone Number', 
+    'Email', 'Website', 'Opening Time', 'Closing Time', 'Business Hours', *SOCIAL_PLATFORMS
+)
 
 # Global cache for website extraction to prevent redundant processing
-WEBSITE_EXTRACTION_CACHE = {}  # domain -> (social_data, emails)
+WEBSITE_EXTRACTION_CACHE = OrderedDict()  # normalized domain -> (social_data, emails), least recently used first
+WEBSITE_CACHE_MAX_ENTRIES = 512
+WEBSITE_EXTRACTION_IN_FLIGHT = {}  # normalized domain -> [crawl currently running for it, number of waiters]
+
+def website_cache_key(url: str) -> str:
+    """Normalize a website URL to the domain its extraction is cached under"""
+    domain = urlparse(url).netloc.lower()
+    return domain[4:] if domain.startswith('www.') else domain
+
+def get_cached_website(domain: str) -> Optional[Tuple[Dict[str, str], List[str]]]:
+    result = WEBSITE_EXTRACTION_CACHE.get(domain)
+    if result is not None:
+        WEBSITE_EXTRACTION_CACHE.move_to_end(domain)
+    return result
+
+def cache_website(domain: str, result: Tuple[Dict[str, str], List[str]]):
+    WEBSITE_EXTRACTION_CACHE[domain] = result
+    WEBSITE_EXTRACTION_CACHE.move_to_end(domain)
+    while len(WEBSITE_EXTRACTION_CACHE) > WEBSITE_CACHE_MAX_ENTRIES:
+        WEBSITE_EXTRACTION_CACHE.popitem(last=False)
 
 class RobustSocialExtractor:
     """Enhanced social media and email extraction class"""
     
-    # Comprehensive social media patterns
+    # Comprehensive social media patterns, captures are capped at the 100 character
+    # path limit that _is_valid_social_url enforces anyway
     SOCIAL_PATTERNS = {
         'Facebook': {
             'domains': ['facebook.com', 'fb.com', 'm.facebook.com', 'www.facebook.com', 'fb.me'],
             'patterns': [
-                r'(?:https?://)?(?:www\.|m\.)?facebook\.com/(?:pages/)?([^/?&#\s]+)',
-                r'(?:https?://)?fb\.com/([^/?&#\s]+)',
-                r'(?:https?://)?fb\.me/([^/?&#\s]+)'
+                r'(?:https?://)?(?:www\.|m\.)?facebook\.com/(?:pages/)?([^/?&#\s]{1,100})',
+                r'(?:https?://)?fb\.com/([^/?&#\s]{1,100})',
+                r'(?:https?://)?fb\.me/([^/?&#\s]{1,100})'
             ],
             'keywords': ['facebook', 'fb page', 'find us on facebook', 'like us on facebook']
         },
         'Instagram': {
             'domains': ['instagram.com', 'instagr.am', 'www.instagram.com'],
             'patterns': [
-                r'(?:https?://)?(?:www\.)?instagram\.com/([^/?&#\s]+)',
-                r'(?:https?://)?instagr\.am/([^/?&#\s]+)',
+                r'(?:https?://)?(?:www\.)?instagram\.com/([^/?&#\s]{1,100})',
+                r'(?:https?://)?instagr\.am/([^/?&#\s]{1,100})',
                 r'@([a-zA-Z0-9._]{1,30})\s*(?:on\s+)?instagram'
             ],
             'keywords': ['instagram', 'insta', 'follow us on instagram', '@']
@@ -58,7 +133,7 @@ class RobustSocialExtractor:
         'Twitter': {
             'domains': ['twitter.com', 'x.com', 'm.twitter.com', 'www.twitter.com', 'www.x.com'],
             'patterns': [
-                r'(?:https?://)?(?:www\.|m\.)?(?:twitter|x)\.com/([^/?&#\s]+)',
+                r'(?:https?://)?(?:www\.|m\.)?(?:twitter|x)\.com/([^/?&#\s]{1,100})',
                 r'@([a-zA-Z0-9_]{1,15})\s*(?:on\s+)?(?:twitter|x)'
             ],
             'keywords': ['twitter', 'tweet', 'follow us on twitter', 'x.com', '@']
@@ -66,25 +141,25 @@ class RobustSocialExtractor:
         'LinkedIn': {
             'domains': ['linkedin.com', 'www.linkedin.com', 'm.linkedin.com'],
             'patterns': [
-                r'(?:https?://)?(?:www\.|m\.)?linkedin\.com/(?:company|in)/([^/?&#\s]+)',
-                r'(?:https?://)?(?:www\.|m\.)?linkedin\.com/pub/([^/?&#\s]+)'
+                r'(?:https?://)?(?:www\.|m\.)?linkedin\.com/(?:company|in)/([^/?&#\s]{1,100})',
+                r'(?:https?://)?(?:www\.|m\.)?linkedin\.com/pub/([^/?&#\s]{1,100})'
             ],
             'keywords': ['linkedin', 'connect with us on linkedin', 'professional network']
         },
         'YouTube': {
             'domains': ['youtube.com', 'youtu.be', 'm.youtube.com', 'www.youtube.com'],
             'patterns': [
-                r'(?:https?://)?(?:www\.|m\.)?youtube\.com/(?:channel|user|c)/([^/?&#\s]+)',
-                r'(?:https?://)?youtu\.be/([^/?&#\s]+)',
-                r'(?:https?://)?(?:www\.)?youtube\.com/@([^/?&#\s]+)'
+                r'(?:https?://)?(?:www\.|m\.)?youtube\.com/(?:channel|user|c)/([^/?&#\s]{1,100})',
+                r'(?:https?://)?youtu\.be/([^/?&#\s]{1,100})',
+                r'(?:https?://)?(?:www\.)?youtube\.com/@([^/?&#\s]{1,100})'
             ],
             'keywords': ['youtube', 'subscribe', 'youtube channel', 'watch us on youtube']
         },
         'TikTok': {
             'domains': ['tiktok.com', 'vm.tiktok.com', 'www.tiktok.com'],
             'patterns': [
-                r'(?:https?://)?(?:www\.|vm\.)?tiktok\.com/@([^/?&#\s]+)',
-                r'(?:https?://)?(?:www\.|vm\.)?tiktok\.com/([^/?&#\s]+)',
+                r'(?:https?://)?(?:www\.|vm\.)?tiktok\.com/@([^/?&#\s]{1,100})',
+                r'(?:https?://)?(?:www\.|vm\.)?tiktok\.com/([^/?&#\s]{1,100})',
                 r'@([a-zA-Z0-9._]{1,24})\s*(?:on\s+)?tiktok'
             ],
             'keywords': ['tiktok', 'follow us on tiktok', 'tik tok']
@@ -92,37 +167,86 @@ class RobustSocialExtractor:
         'Yelp': {
             'domains': ['yelp.com', 'm.yelp.com', 'www.yelp.com'],
             'patterns': [
-                r'(?:https?://)?(?:www\.|m\.)?yelp\.com/biz/([^/?&#\s]+)',
-                r'(?:https?://)?(?:www\.|m\.)?yelp\.com/([^/?&#\s]+)'
+                r'(?:https?://)?(?:www\.|m\.)?yelp\.com/biz/([^/?&#\s]{1,100})',
+                r'(?:https?://)?(?:www\.|m\.)?yelp\.com/([^/?&#\s]{1,100})'
             ],
             'keywords': ['yelp', 'review us on yelp', 'find us on yelp']
         },
         'WhatsApp': {
             'domains': ['wa.me', 'api.whatsapp.com', 'whatsapp.com'],
             'patterns': [
-                r'(?:https?://)?wa\.me/([0-9]+)',
-                r'(?:https?://)?api\.whatsapp\.com/send\?phone=([0-9]+)',
-                r'whatsapp:([0-9+\s\-()]+)'
+                r'(?:https?://)?wa\.me/([0-9]{1,100})',
+                r'(?:https?://)?api\.whatsapp\.com/send\?phone=([0-9]{1,100})',
+                r'whatsapp:([0-9+\s\-()]{1,100})'
             ],
             'keywords': ['whatsapp', 'message us on whatsapp', 'whatsapp business']
         },
         'Pinterest': {
             'domains': ['pinterest.com', 'pin.it', 'www.pinterest.com'],
             'patterns': [
-                r'(?:https?://)?(?:www\.)?pinterest\.com/([^/?&#\s]+)',
-                r'(?:https?://)?pin\.it/([^/?&#\s]+)'
+                r'(?:https?://)?(?:www\.)?pinterest\.com/([^/?&#\s]{1,100})',
+                r'(?:https?://)?pin\.it/([^/?&#\s]{1,100})'
             ],
             'keywords': ['pinterest', 'pin us', 'follow us on pinterest']
         }
     }
     
-    # Enhanced email patterns
+    # Platform URL and handle patterns, compiled once at class load
+    _PATTERN_RES = {
+        platform: [re.compile(pattern, re.IGNORECASE) for pattern in config['patterns']]
+        for platform, config in SOCIAL_PATTERNS.items()
+    }
+    
+    # Domain -> platform, so a link's host resolves with dict lookups
+    _DOMAIN_TO_PLATFORM = {
+        domain: platform
+        for platform, config in SOCIAL_PATTERNS.items()
+        for domain in config['domains']
+    }
+    
+    # Profile URL templates for '@handle' matches
+    _AT_BUILDERS = {
+        'Instagram': 'https://instagram.com/{u}',
+        'Twitter': 'https://x.com/{u}',
+    }
+    
+    # Profile URL builders for scheme-less matches: (username, matched_text) -> url
+    _URL_BUILDERS = {
+        'Facebook': lambda u, m: f"https://facebook.com/{u}",
+        'Instagram': lambda u, m: f"https://instagram.com/{u}",
+        'Twitter': lambda u, m: f"https://x.com/{u}",
+        # Company pages and personal profiles live under different paths
+        'LinkedIn': lambda u, m: f"https://linkedin.com/{'company' if 'company' in m.lower() else 'in'}/{u}",
+        'YouTube': lambda u, m: f"https://youtube.com/{u}" if '@' in u else f"https://youtube.com/channel/{u}",
+        'TikTok': lambda u, m: f"https://tiktok.com/@{u}",
+        'Yelp': lambda u, m: f"https://yelp.com/biz/{u}",
+        'Pinterest': lambda u, m: f"https://pinterest.com/{u}",
+    }
+    
+    # Enhanced email patterns, bounded to the RFC 5321 local part and domain
+    # lengths so long runs of address-like characters cannot backtrack for long
     EMAIL_PATTERNS = [
-        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        r'mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',
-        r'email\s*:?\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',
-        r'contact\s*:?\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
+        r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Z|a-z]{2,24}\b',
+        r'mailto:([A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Z|a-z]{2,24})',
+        r'email\s{0,10}:?\s{0,10}([A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Z|a-z]{2,24})',
+        r'contact\s{0,10}:?\s{0,10}([A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Z|a-z]{2,24})'
     ]
+    _EMAIL_RES = [re.compile(pattern, re.IGNORECASE) for pattern in EMAIL_PATTERNS]
+    _FAKE_EMAIL_RE = re.compile(r'no-?reply|donotreply|example')
+    
+    # Scans used when no platform pattern matched
+    _URL_RE = re.compile(r'https?://[^\s\'"<>()]+\.[a-zA-Z]{2,}[^\s\'"<>()]*')
+    _HANDLE_RE = re.compile(r'@([A-Za-z0-9._]{3,30})\b')
+    
+    # Profile path checks used by _is_valid_social_url
+    _NUMERIC_PATH_RE = re.compile(r'^/\d+/?$')
+    _DOTTED_NAME_PATH_RE = re.compile(r'/[a-zA-Z][\w.]{2,}/?')
+    _WORD_NAME_PATH_RE = re.compile(r'/[a-zA-Z][\w]{2,}/?')
+    _HYPHENATED_NAME_PATH_RE = re.compile(r'/[a-zA-Z][\w-]{2,}/?')
+    _YOUTUBE_HANDLE_PATH_RE = re.compile(r'/@[\w-]{3,}/?')
+    _TIKTOK_HANDLE_PATH_RE = re.compile(r'/@[\w.]{3,}/?')
+    _YELP_BIZ_PATH_RE = re.compile(r'/biz/[a-zA-Z0-9_-]{3,}/?')
+    _WHATSAPP_NUMBER_PATH_RE = re.compile(r'/\d{7,}/?')
     
     # Common false positive domains to exclude
     EXCLUDED_DOMAINS = {
@@ -130,6 +254,27 @@ class RobustSocialExtractor:
         'yoursite.com', 'website.com', 'company.com', 'business.com', 'email.com'
     }
     
+    @staticmethod
+    def _first_valid_match(pattern, text: str, platform: str) -> str:
+        """First match of pattern in text that builds a valid profile URL for platform, or ''"""
+        for match in pattern.finditer(text):
+            # Construct full URL if needed
+            full_url = match.group(0)
+            if not full_url.startswith('http'):
+                at_builder = RobustSocialExtractor._AT_BUILDERS.get(platform)
+                if at_builder and full_url.startswith('@'):
+                    full_url = at_builder.format(u=full_url[1:])
+                else:
+                    # Try to build URL from the matched group
+                    username = match.group(1) if match.groups() else match.group(0)
+                    builder = RobustSocialExtractor._URL_BUILDERS.get(platform)
+                    if builder:
+                        full_url = builder(username, full_url)
+            
+            if RobustSocialExtractor._is_valid_social_url(full_url, platform):
+                return full_url.strip()
+        return ''
+    
     @staticmethod
     def extract_social_from_text(text: str) -> Dict[str, str]:
         """Extract social media links from text using optimized pattern matching"""
@@ -141,88 +286,55 @@ class RobustSocialExtractor:
         text_lower = text.lower()
         
         # First priority: Find fully formed URLs for each platform (most reliable)
-        for platform, config in RobustSocialExtractor.SOCIAL_PATTERNS.items():
-            # Exit early if we already found this platform
-            if results[platform]:
-                continue
-                
-            # Quick domain check before using regex
-            if not any(domain in text_lower for domain in config['domains']):
-                continue
-                
-            # Use domain-specific regex patterns for direct URL matches
-            for pattern in config['patterns']:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
-                for match in matches:
-                    # Construct full URL if needed
-                    full_url = match.group(0)
-                    if not full_url.startswith('http'):
-                        if platform == 'Instagram' and full_url.startswith('@'):
-                            full_url = f"https://instagram.com/{full_url[1:]}"
-                        elif platform == 'Twitter' and full_url.startswith('@'):
-                            full_url = f"https://x.com/{full_url[1:]}"
-                        else:
-                            # Try to build URL from the matched group
-                            username = match.group(1) if match.groups() else match.group(0)
-                            if platform == 'Facebook':
-                                full_url = f"https://facebook.com/{username}"
-                            elif platform == 'Instagram':
-                                full_url = f"https://instagram.com/{username}"
-                            elif platform == 'Twitter':
-                                full_url = f"https://x.com/{username}"
-                            elif platform == 'LinkedIn':
-                                # Check if it's a company or personal profile
-                                if 'company' in match.group(0).lower():
-                                    full_url = f"https://linkedin.com/company/{username}"
-                                else:
-                                    full_url = f"https://linkedin.com/in/{username}"
-                            elif platform == 'YouTube':
-                                if '@' in username:
-                                    full_url = f"https://youtube.com/{username}"
-                                else:
-                                    full_url = f"https://youtube.com/channel/{username}"
-                            elif platform == 'TikTok':
-                                full_url = f"https://tiktok.com/@{username}"
-                            elif platform == 'Yelp':
-                                full_url = f"https://yelp.com/biz/{username}"
-                            elif platform == 'Pinterest':
-                                full_url = f"https://pinterest.com/{username}"
-                    
-                    if RobustSocialExtractor._is_valid_social_url(full_url, platform):
-                        results[platform] = full_url.strip()
+        # Quick domain check before using regex
+        pending = {
+            platform for platform, config in RobustSocialExtractor.SOCIAL_PATTERNS.items()
+            if any(domain in text_lower for domain in config['domains'])
+        }
+        # Social URLs need a platform domain in the text and handles need an '@', without either there is nothing to find
+        domains_mentioned = bool(pending)
+        if not domains_mentioned and '@' not in text:
+            return results
+        
+        # Each pattern is scanned on its own so matches stay leftmost and non-overlapping,
+        # a scheme-less suffix inside a longer URL is never taken as a profile
+        if pending:
+            for platform, patterns in RobustSocialExtractor._PATTERN_RES.items():
+                if platform not in pending:
+                    continue
+                for pattern in patterns:
+                    url = RobustSocialExtractor._first_valid_match(pattern, text, platform)
+                    if url:
+                        results[platform] = url
                         break
-                
-                # Exit early if we found a match
-                if results[platform]:
-                    break
+            
+            # Every platform already has a validated URL, nothing left to look for
+            if all(results.values()):
+                return results
         
         # Second priority: For remaining platforms, extract from https URLs
-        if not all(results.values()):
+        # (a social URL's host is itself a domain mention, so this is skipped when there are none)
+        if domains_mentioned:
             # Extract all https URLs once
-            url_pattern = r'https?://[^\s\'"<>()]+\.[a-zA-Z]{2,}[^\s\'"<>()]*'
-            all_urls = re.findall(url_pattern, text)
+            all_urls = RobustSocialExtractor._URL_RE.findall(text)
             
             # Check each URL against remaining platforms
             for url in all_urls:
-                for platform, link in results.items():
-                    if link:  # Skip if already found
-                        continue
-                        
-                    domains = RobustSocialExtractor.SOCIAL_PATTERNS[platform]['domains']
-                    if any(domain in url.lower() for domain in domains):
-                        if RobustSocialExtractor._is_valid_social_url(url, platform):
-                            results[platform] = url
+                platform = RobustSocialExtractor.platform_for_url(url)
+                if platform and not results[platform] and RobustSocialExtractor._is_valid_social_url(url, platform):
+                    results[platform] = url
+                    if all(results.values()):
+                        return results
         
         # Third priority: Handle social media handles with @ symbol (for specific platforms)
-        missing_platforms = ['Instagram', 'Twitter', 'TikTok']
-        missing_platforms = [p for p in missing_platforms if not results[p]]
+        missing_platforms = {p for p in ('Instagram', 'Twitter', 'TikTok') if not results[p]} if '@' in text else set()
         
         if missing_platforms:
             # Find all potential handles with @ symbol (only once)
-            handle_pattern = r'@([A-Za-z0-9._]{3,30})\b'
-            handle_matches = list(re.finditer(handle_pattern, text))
-            
-            for match in handle_matches:
+            for match in RobustSocialExtractor._HANDLE_RE.finditer(text):
+                # '@' inside a URL path or an email address is not a standalone handle
+                if match.start() and (text[match.start() - 1] == '/' or text[match.start() - 1].isalnum()):
+                    continue
                 handle = match.group(1)
                 # Get context around the handle
                 start = max(0, match.start() - 20)
@@ -231,20 +343,43 @@ class RobustSocialExtractor:
                 
                 # Check if context helps identify the platform
                 if 'Instagram' in missing_platforms and ('instagram' in context or 'insta' in context):
-                    results['Instagram'] = f"https://instagram.com/{handle}"
+                    platform, url = 'Instagram', f"https://instagram.com/{handle}"
                 elif 'Twitter' in missing_platforms and ('twitter' in context or 'tweet' in context or 'x.com' in context):
-                    results['Twitter'] = f"https://x.com/{handle}"
+                    platform, url = 'Twitter', f"https://x.com/{handle}"
                 elif 'TikTok' in missing_platforms and ('tiktok' in context or 'tik tok' in context):
-                    results['TikTok'] = f"https://tiktok.com/@{handle}"
-        
-        # Final validation pass - validate all URLs once at the end
-        for platform, url in list(results.items()):
-            if url and not RobustSocialExtractor._is_valid_social_url(url, platform):
-                results[platform] = ''
+                    platform, url = 'TikTok', f"https://tiktok.com/@{handle}"
+                else:
+                    continue
+                
+                # Earlier priorities only keep validated URLs, so handles are the only thing left to check
+                if RobustSocialExtractor._is_valid_social_url(url, platform):
+                    results[platform] = url
+                    missing_platforms.discard(platform)
+                    if not missing_platforms:
+                        break
         
         return results
     
+    # Navigation bars repeat the same links on every page, so verdicts are memoized
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def platform_for_url(url: str) -> Optional[str]:
+        """Return the social platform hosting url, matching the host and then each parent domain"""
+        try:
+            host = urlparse(url).hostname
+        except ValueError:
+            return None
+        
+        # m.facebook.com -> facebook.com -> com
+        while host:
+            platform = RobustSocialExtractor._DOMAIN_TO_PLATFORM.get(host)
+            if platform:
+                return platform
+            host = host.partition('.')[2]
+        return None
+    
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _is_valid_social_url(url: str, platform: str) -> bool:
         """Validate if the URL is a legitimate social media URL with optimized validation"""
         if not url or len(url) < 10:
@@ -280,11 +415,11 @@ class RobustSocialExtractor:
                     return False
                     
                 # Reject numeric-only IDs which are typically not business pages
-                if re.match(r'^/\d+/?$', path):
+                if RobustSocialExtractor._NUMERIC_PATH_RE.match(path):
                     return False
                     
                 # Must contain a username path segment that looks valid
-                if not re.search(r'/[a-zA-Z][\w.]{2,}/?', path):
+                if not RobustSocialExtractor._DOTTED_NAME_PATH_RE.search(path):
                     return False
                     
             elif platform == 'Instagram':
@@ -297,7 +432,7 @@ class RobustSocialExtractor:
                     return False
                     
                 # Must have a valid username format
-                if not re.search(r'/[a-zA-Z][\w.]{2,}/?', path):
+                if not RobustSocialExtractor._DOTTED_NAME_PATH_RE.search(path):
                     return False
                     
             elif platform == 'Twitter':
@@ -310,7 +445,7 @@ class RobustSocialExtractor:
                     return False
                     
                 # Must have a valid username format
-                if not re.search(r'/[a-zA-Z][\w]{2,}/?', path):
+                if not RobustSocialExtractor._WORD_NAME_PATH_RE.search(path):
                     return False
                     
             elif platform == 'LinkedIn':
@@ -333,16 +468,16 @@ class RobustSocialExtractor:
                     return False
                     
                 # Ensure @ usernames are valid
-                if '/@' in path and not re.search(r'/@[\w-]{3,}/?', path):
+                if '/@' in path and not RobustSocialExtractor._YOUTUBE_HANDLE_PATH_RE.search(path):
                     return False
                     
             elif platform == 'TikTok':
                 # Must have a username
-                if not path or (path.startswith('/@') and not re.search(r'/@[\w.]{3,}/?', path)):
+                if not path or (path.startswith('/@') and not RobustSocialExtractor._TIKTOK_HANDLE_PATH_RE.search(path)):
                     return False
                     
                 # If not using @ format, must still have a valid username pattern
-                if not path.startswith('/@') and not re.search(r'/[a-zA-Z][\w.]{2,}/?', path):
+                if not path.startswith('/@') and not RobustSocialExtractor._DOTTED_NAME_PATH_RE.search(path):
                     return False
                     
             elif platform == 'Yelp':
@@ -351,13 +486,13 @@ class RobustSocialExtractor:
                     return False
                     
                 # Must have valid business name
-                if not re.search(r'/biz/[a-zA-Z0-9_-]{3,}/?', path):
+                if not RobustSocialExtractor._YELP_BIZ_PATH_RE.search(path):
                     return False
                     
             elif platform == 'WhatsApp':
                 # Check for wa.me format (most common)
                 if 'wa.me' in domain:
-                    return bool(re.search(r'/\d{7,}/?', path))
+                    return bool(RobustSocialExtractor._WHATSAPP_NUMBER_PATH_RE.search(path))
                     
                 # Check for whatsapp.com API format
                 if 'whatsapp.com' in domain:
@@ -369,7 +504,7 @@ class RobustSocialExtractor:
                     return False
                     
                 # Must have a valid username
-                if not re.search(r'/[a-zA-Z][\w-]{2,}/?', path):
+                if not RobustSocialExtractor._HYPHENATED_NAME_PATH_RE.search(path):
                     return False
                     
                 # Reject pins/boards which aren't profile URLs
@@ -386,135 +521,285 @@ class RobustSocialExtractor:
     @staticmethod
     def extract_emails_from_text(text: str) -> List[str]:
         """Extract email addresses from text with enhanced validation"""
-        emails = set()
+        # Every pattern needs an '@', most text chunks have none
+        if '@' not in text:
+            return []
+        
+        # dict keeps the first-seen order, so the address listed first on the page comes first
+        emails = {}
         
-        for pattern in RobustSocialExtractor.EMAIL_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in RobustSocialExtractor._EMAIL_RES:
+            for match in pattern.finditer(text):
                 email = match.group(1) if match.groups() else match.group(0)
                 email = email.strip().lower()
                 
-                if RobustSocialExtractor._is_valid_email(email):
-                    emails.add(email)
+                if email not in emails and RobustSocialExtractor._is_valid_email(email):
+                    emails[email] = None
         
         return list(emails)
     
     @staticmethod
     def _is_valid_email(email: str) -> bool:
-        """Validate email address"""
-        if not email or '@' not in email:
+        """Validate an address already matched by EMAIL_PATTERNS, so its format is known to be good"""
+        local, _, domain = email.rpartition('@')
+        
+        # Basic validation
+        if len(local) < 1 or len(domain) < 3:
             return False
         
-        try:
-            local, domain = email.rsplit('@', 1)
-            
-            # Basic validation
-            if len(local) < 1 or len(domain) < 3:
-                return False
-            
-            # Check for excluded domains
+        # Check for excluded domains, including their subdomains (mail.test.com)
+        while domain:
             if domain in RobustSocialExtractor.EXCLUDED_DOMAINS:
                 return False
-            
-            # Check for common fake patterns
-            if any(fake in email for fake in ['noreply', 'no-reply', 'donotreply', 'example']):
-                return False
-            
-            # Basic format validation
-            if not re.match(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$', email):
-                return False
-            
-            return True
-        except:
-            return False
+            domain = domain.partition('.')[2]
+        
+        # Check for common fake patterns
+        return not RobustSocialExtractor._FAKE_EMAIL_RE.search(email)
 
-async def gemini_generate(prompt):
+JSON_DECODER = json.JSONDecoder()
+
+def extract_json_object(text: str):
+    """Decode the first JSON object in a model response, including nested objects"""
+    start = text.find('{')
+    while start != -1:
+        try:
+            # Single pass from the brace, no regex backtracking
+            obj, _ = JSON_DECODER.raw_decode(text, start)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError as e:
+            error = e
+        # Prose before the JSON can contain braces too, try the next one
+        start = text.find('{', start + 1)
+    if '{' in text:
+        logger.warning('Gemini JSON decode error: %s', error)
+        logger.debug('Gemini response text: %s', text)
+    return None
+
+def extract_json_array(text: str):
+    """Decode the first JSON array in a model response"""
+    start = text.find('[')
+    if start == -1:
+        return None
+    try:
+        obj, _ = JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError as e:
+        logger.warning('Gemini JSON decode error: %s', e)
+        logger.debug('Gemini response text: %s', text)
+        return None
+    return obj if isinstance(obj, list) else None
+
+async def gemini_generate(prompt, semaphore: Optional[asyncio.Semaphore] = None, parse=extract_json_object):
+    """Call Gemini through the shared HTTP client; the optional semaphore bounds concurrent requests"""
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(1)
     headers = {"Content-Type": "application/json"}
     data = {
         "contents": [{"parts": [{"text": prompt}]}]
     }
     max_attempts = 5
-    async with httpx.AsyncClient(timeout=30) as client:
+    client = get_http_client()
+    async with semaphore:
         for attempt in range(max_attempts):
             try:
-                wait_time = (1.5 ** attempt) + (0.3 * (os.urandom(1)[0] % 3))
-                await asyncio.sleep(wait_time)
+                # Only back off before a retry, the first request goes out immediately
+                if attempt:
+                    wait_time = (1.5 ** attempt) + random.random() * 0.6
+                    await asyncio.sleep(wait_time)
                 response = await client.post(GEMINI_API_URL, headers=headers, json=data)
                 response.raise_for_status()
                 result = response.json()
                 text = result.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
                 
                 # Extract JSON from response
-                json_match = re.search(r'\{.*?\}', text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                    try:
-                        decoder = json.JSONDecoder()
-                        obj, _ = decoder.raw_decode(json_str)
-                        return obj
-                    except Exception as e:
-                        print(f"Gemini JSON decode error: {e}\nResponse text: {text}")
-                        return None
-                print(f"Gemini response not valid JSON: {text}")
+                obj = parse(text)
+                if obj is not None:
+                    return obj
+                logger.warning('Gemini response not valid JSON')
+                logger.debug('Gemini response text: %s', text)
                 return None
             except httpx.TimeoutException as e:
-                print(f"Gemini API timeout (attempt {attempt+1}): {e}. Retrying...")
+                logger.warning('Gemini API timeout (attempt %s): %s. Retrying...', attempt + 1, e)
                 continue
             except httpx.HTTPStatusError as e:
-                print(f"Gemini API HTTP error (attempt {attempt+1}): {e}")
+                logger.warning('Gemini API HTTP error (attempt %s): %s', attempt + 1, e)
                 if e.response.status_code == 429:
-                    print(f"Rate limited, backing off...")
+                    logger.warning('Rate limited, backing off...')
                     continue
                 else:
                     if attempt == max_attempts - 1:
                         return None
             except Exception as e:
-                print(f"Gemini API error (attempt {attempt+1}): {e}")
+                logger.warning('Gemini API error (attempt %s): %s', attempt + 1, e)
                 if attempt == max_attempts - 1:
                     return None
                 continue
 
-def extract_with_gemini(raw_text):
-    prompt = f"""
-Extract the following business details from the text below. Return a JSON object with these keys: Business Name, Business Type, Address, Phone Number, Email, Website, Opening Time, Closing Time, Business Hours. 
+GEMINI_FIELD_KEYS = 'Business Name, Business Type, Address, Phone Number, Email, Website, Opening Time, Closing Time, Business Hours'
 
-For Opening Time and Closing Time, extract the standard opening and closing hours for today or the most typical day if today's hours aren't specified.
+GEMINI_FIELD_RULES = """For Opening Time and Closing Time, extract the standard opening and closing hours for today or the most typical day if today's hours aren't specified.
 
 For Business Hours, extract the complete weekly schedule in a standardized format with each day of the week, like this:
 "Monday: 9:00 AM - 5:00 PM; Tuesday: 9:00 AM - 5:00 PM; Wednesday: 9:00 AM - 5:00 PM; Thursday: 9:00 AM - 5:00 PM; Friday: 9:00 AM - 5:00 PM; Saturday: 10:00 AM - 3:00 PM; Sunday: Closed"
 
 Include all seven days of the week if available. For days when the business is closed, use "Closed". For businesses open 24 hours, use "Open 24 hours". If hours for a specific day are unknown, use "Hours not available".
 
-If a field is missing from the text, use an empty string.
+If a field is missing from the text, use an empty string."""
+
+def extract_with_gemini(raw_text, semaphore: Optional[asyncio.Semaphore] = None):
+    prompt = f"""
+Extract the following business details from the text below. Return a JSON object with these keys: {GEMINI_FIELD_KEYS}. 
+
+{GEMINI_FIELD_RULES}
 
 Text:
 {raw_text}
 """
-    return gemini_generate(prompt)
+    return gemini_generate(prompt, semaphore)
+
+def extract_with_gemini_batch(raw_texts, semaphore: Optional[asyncio.Semaphore] = None):
+    """One Gemini request for several cards, resolves to a list with one dict per text (or None)"""
+    inputs = '\n\n'.join(f"INPUT {number}:\n{raw_text}" for number, raw_text in enumerate(raw_texts, 1))
+    prompt = f"""
+Extract the following business details from each numbered INPUT below. Return a JSON array with exactly one object per INPUT, in the same order, each with these keys: {GEMINI_FIELD_KEYS}. 
+
+{GEMINI_FIELD_RULES}
+
+{inputs}
+"""
+    return gemini_generate(prompt, semaphore, parse=extract_json_array)
+
+class GeminiBatcher:
+    """Collects card texts from the card workers and sends them to Gemini a batch at a time"""
+    def __init__(self, semaphore: asyncio.Semaphore, batch_size=GEMINI_BATCH_SIZE, max_wait=GEMINI_BATCH_WAIT):
+        self.semaphore = semaphore
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.pending = []  # (raw_text, future) waiting for the next batch
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.tasks = set()
+
+    async def extract(self, raw_text):
+        """Queue raw_text for the next batch and wait for its fields"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((raw_text, future))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.max_wait, self.flush)
+        return await future
+
+    def flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        batch, self.pending = self.pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _send(self, batch):
+        try:
+            results = await self._request([raw_text for raw_text, _ in batch])
+            for (_, future), fields in zip(batch, results):
+                if not future.done():
+                    future.set_result(fields if isinstance(fields, dict) else None)
+        finally:
+            # Cancelled by close(), the cards waiting on this batch must not hang
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _request(self, raw_texts):
+        try:
+            if len(raw_texts) == 1:
+                return [await extract_with_gemini(raw_texts[0], self.semaphore)]
+            results = await extract_with_gemini_batch(raw_texts, self.semaphore)
+            # A malformed or short array is retried card by card
+            if not results or len(results) != len(raw_texts):
+                results = await asyncio.gather(
+                    *(extract_with_gemini(raw_text, self.semaphore) for raw_text in raw_texts),
+                    return_exceptions=True,
+                )
+            return results
+        except Exception as e:
+            logger.warning('Gemini batch error: %s', e)
+            return [None] * len(raw_texts)
+
+    def close(self):
+        """Drop queued cards and cancel batches still in flight"""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        for _, future in self.pending:
+            future.cancel()
+        self.pending = []
+        for task in self.tasks:
+            task.cancel()
+
+# Translation table that deletes zero-width characters
+ZERO_WIDTH_TABLE = str.maketrans('', '', '\u200B\u200C\u200D\uFEFF')
+
+# Fallback patterns for the Google Maps panel text
+PHONE_PATTERN = re.compile(r'(\+?\d[\d\s\-().]{8,}\d)')
+WEBSITE_DOMAIN_PATTERN = re.compile(r'([a-zA-Z0-9\-\.]+\.(?:com|net|org|biz|info|co|us|in|uk|ca|au|io|me|site|store|online|tech|ai|app))')
+
+# Normalization patterns for duplicate detection and export
+NON_PHONE_CHAR_PATTERN = re.compile(r'[^\d+]')
+NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+BUSINESS_SUFFIX_PATTERN = re.compile(r'\b(inc|llc|ltd|corp|co|company|corporation|incorporated)\b\.?')
 
 def clean_field(value):
     if not value:
         return ''
     # Remove non-printable characters
-    value = re.sub(r'[\u200B-\u200D\uFEFF]', '', value)
-    # Remove excessive whitespace
-    lines = [line.strip() for line in value.split('\n') if line.strip()]
-    # Remove duplicates while preserving order
-    seen = set()
-    cleaned = [line for line in lines if not (line in seen or seen.add(line))]
-    return ' '.join(cleaned).strip()
-
-async def safe_text(page, selector):
+    value = value.translate(ZERO_WIDTH_TABLE)
+    # Strip each line once, drop the empty ones and remove duplicates while preserving order
+    lines = dict.fromkeys(filter(None, (line.strip() for line in value.split('\n'))))
+    return ' '.join(lines)
+
+def clean_series(series):
+    """Vectorized clean_field for a Series of strings"""
+    # Single-line values without zero-width characters only need stripping
+    cleaned = series.str.strip()
+    needs_full_clean = series.str.contains('[\n\u200B\u200C\u200D\uFEFF]', regex=True)
+    if needs_full_clean.any():
+        cleaned.loc[needs_full_clean] = series[needs_full_clean].map(clean_field)
+    return cleaned
+
+async def block_heavy_resources(route):
+    """Route handler that aborts images, media, fonts and tracker requests"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_TRACKER_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def wait_for_more_results(page, selector, previous_count, timeout=2000):
+    """Wait until more than previous_count elements match selector; False on timeout."""
     try:
-        elements = await page.query_selector_all(selector)
-        for el in elements:
-            text = await el.inner_text()
-            if text.strip():
-                return text.strip()
-    except Exception as e:
-        print(f"Error in safe_text for selector '{selector}': {e}")
-    return ''
+        await page.wait_for_function(
+            '([selector, previous]) => document.querySelectorAll(selector).length > previous',
+            arg=[selector, previous_count],
+            timeout=timeout,
+        )
+        return True
+    except Exception:
+        return False
 
+async def wait_for_network_idle(page, timeout):
+    """Wait until the page stops loading resources; False if it is still busy after timeout."""
+    try:
+        await page.wait_for_load_state('networkidle', timeout=timeout)
+        return True
+    except Exception:
+        # Analytics beacons and chat widgets can keep a page busy indefinitely
+        return False
+
+@lru_cache(maxsize=4096)
 def is_valid_url(url):
     """Check if a URL is valid and accessible"""
     try:
@@ -532,17 +817,17 @@ def normalize_url(url):
         url = 'https://' + url
     return url
 
-def create_business_hash(name, address, phone):
-    """Create a unique hash for a business to detect duplicates, with improved address normalization"""
+def create_business_hash(name, address, phone) -> tuple:
+    """Create an in-memory dedup key for a business, with improved address normalization"""
     # Handle all empty inputs
     if not name and not address and not phone:
-        # Generate a random hash to ensure it doesn't match anything
-        return hashlib.md5(f"empty_business_{os.urandom(8).hex()}".encode()).hexdigest()
+        # A fresh object is equal only to itself, so the key never matches anything
+        return (object(),)
     
     # Normalize name: lowercase, strip whitespace, remove common business designations
     name_norm = clean_field(name).lower().strip()
-    name_norm = re.sub(r'\b(inc|llc|ltd|corp|co|company|corporation|incorporated)\b\.?', '', name_norm)
-    name_norm = re.sub(r'[^\w\s]', '', name_norm).strip()  # Remove punctuation
+    name_norm = BUSINESS_SUFFIX_PATTERN.sub('', name_norm)
+    name_norm = PUNCTUATION_PATTERN.sub('', name_norm).strip()  # Remove punctuation
     
     # Normalize address: extract key parts and remove noise
     address_norm = ''
@@ -553,18 +838,18 @@ def create_business_hash(name, address, phone):
             # Get first part (usually street address)
             street = address_parts[0].strip()
             # Extract just numbers and letters from street address
-            street = re.sub(r'[^\w\s]', '', street).strip()
+            street = PUNCTUATION_PATTERN.sub('', street).strip()
             address_norm = street
             
             # Add city if available (usually the second part)
             if len(address_parts) > 1:
-                city = re.sub(r'[^\w\s]', '', address_parts[1].strip())
+                city = PUNCTUATION_PATTERN.sub('', address_parts[1].strip())
                 address_norm = f"{address_norm}_{city}"
     
     # Normalize phone: strip to digits only
     phone_norm = ''
     if phone:
-        phone_norm = re.sub(r'[^\d]', '', clean_field(phone))
+        phone_norm = NON_DIGIT_PATTERN.sub('', clean_field(phone))
         # Keep last 7 digits if available (more unique than country/area codes which can be shared)
         if len(phone_norm) >= 7:
             phone_norm = phone_norm[-7:]
@@ -586,9 +871,45 @@ def create_business_hash(name, address, phone):
         # Last resort, use just address
         components = [f"addr:{address_norm}"]
     
-    # Join components and create hash
-    unique_string = "|".join(components)
-    return hashlib.md5(unique_string.encode()).hexdigest()
+    # The key only lives in this run's dedup set, the set hashes the tuple itself
+    return tuple(components)
+
+def business_hash_keys(names, addresses, phones):
+    """Vectorized create_business_hash normalization for Series of already cleaned fields, returns the key strings"""
+    # Normalize name: lowercase, strip whitespace, remove common business designations
+    name_norm = names.str.lower().str.strip()
+    name_norm = name_norm.str.replace(BUSINESS_SUFFIX_PATTERN, '', regex=True)
+    name_norm = name_norm.str.replace(PUNCTUATION_PATTERN, '', regex=True).str.strip()
+    
+    # Normalize address: street and city without punctuation
+    address_parts = addresses.str.lower().str.split(',')
+    street = address_parts.str[0].str.strip().str.replace(PUNCTUATION_PATTERN, '', regex=True).str.strip()
+    # Kept as strings, with no comma anywhere the second part would otherwise be an all-NaN float column
+    city = address_parts.str[1].astype('string').str.strip().str.replace(PUNCTUATION_PATTERN, '', regex=True)
+    address_norm = street.where(city.isna(), street + '_' + city)
+    
+    # Normalize phone: digits only, last 7 digits if available
+    phone_norm = phones.str.replace(NON_DIGIT_PATTERN, '', regex=True)
+    phone_norm = phone_norm.where(phone_norm.str.len() < 7, phone_norm.str[-7:])
+    
+    # Same weighted components as create_business_hash
+    phone_part = ('|phone:' + phone_norm).where(phone_norm != '', '')
+    address_part = ('|addr:' + address_norm).where(address_norm != '', '')
+    keys = ('name:' + name_norm + phone_part + address_part).where(
+        name_norm != '',
+        ('phone:' + phone_norm + address_part).where(phone_norm != '', 'addr:' + address_norm),
+    )
+    
+    # All-empty businesses never match anything
+    all_empty = (names == '') & (addresses == '') & (phones == '')
+    return keys.where(~all_empty, 'empty:' + pd.Series(range(len(keys)), index=keys.index).astype(str))
+
+# Business hours parsing patterns
+HOURS_SEPARATOR_PATTERN = re.compile(r'[;,]')
+DAY_HOURS_PATTERNS = {
+    day: re.compile(f"{day}:?\\s*(.*)", re.IGNORECASE)
+    for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+}
 
 def standardize_business_hours(business_hours):
     """
@@ -605,7 +926,7 @@ def standardize_business_hours(business_hours):
     day_hours = {day: 'Hours not available' for day in days_of_week}
     
     # Split the input by semicolons or commas
-    parts = re.split(r'[;,]', business_hours)
+    parts = HOURS_SEPARATOR_PATTERN.split(business_hours)
     
     # Process each part
     for part in parts:
@@ -619,7 +940,7 @@ def standardize_business_hours(business_hours):
             if part.lower().startswith(day.lower()):
                 day_match = day
                 # Extract hours portion (everything after the day name and colon)
-                hours_match = re.search(f"{day}:?\s*(.*)", part, re.IGNORECASE)
+                hours_match = DAY_HOURS_PATTERNS[day].search(part)
                 if hours_match:
                     hours = hours_match.group(1).strip()
                     day_hours[day] = hours
@@ -633,16 +954,160 @@ class ScraperController:
     def __init__(self):
         self.stop_scrolling_requested = False
         self.stop_all_requested = False
+        self.stop_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start_run(self):
+        """Create the stop event for a scrape run, must be called from the run's event loop"""
+        self._loop = asyncio.get_running_loop()
+        self.stop_event = asyncio.Event()
+        if self.stop_all_requested:
+            self.stop_event.set()
 
     def request_stop_scrolling(self):
         self.stop_scrolling_requested = True
 
     def request_stop_all(self):
         self.stop_all_requested = True
+        # Called from the UI thread, the event belongs to the scraper's loop
+        if self._loop is not None and self.stop_event is not None:
+            try:
+                self._loop.call_soon_threadsafe(self.stop_event.set)
+            except RuntimeError:
+                pass  # The run has already finished and closed its loop
 
 controller = ScraperController()
 
-async def enhanced_extract_from_website(url: str, main_context) -> Tuple[Dict[str, str], List[str]]:
+class BusinessCsvWriter:
+    """Appends finished businesses to a CSV file as they are extracted, so partial results survive a crash"""
+    def __init__(self, filename):
+        # The CSV is only a side output, a locked or unwritable file turns streaming off instead of failing the run
+        try:
+            self.file = open(filename, 'w', newline='', encoding='utf-8-sig')
+        except OSError as e:
+            logger.warning('Could not open %s, businesses will not be streamed to CSV: %s', filename, e)
+            self.file = None
+            return
+        self.writer = csv.DictWriter(self.file, fieldnames=COLUMN_ORDER, extrasaction='ignore')
+        self.writer.writeheader()
+
+    def write(self, business_data):
+        if self.file is None:
+            return
+        self.writer.writerow(business_data)
+        self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+class PagePool:
+    """Warm browser pages reused across website crawls instead of opening a page per URL"""
+    def __init__(self):
+        self.pages = asyncio.Queue()
+
+    @classmethod
+    async def create(cls, context, size):
+        pool = cls()
+        for _ in range(size):
+            pool.pages.put_nowait(await context.new_page())
+        return pool
+
+    async def acquire(self):
+        return await self.pages.get()
+
+    async def release(self, page):
+        # Leave the page blank so the next website starts from a clean state
+        try:
+            await page.goto('about:blank')
+        except Exception:
+            pass
+        self.pages.put_nowait(page)
+
+# Shared HTTP client (connection pooling + HTTP/2), created lazily inside the running event loop
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            follow_redirects=True,
+            headers={'User-Agent': USER_AGENT},
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
+    return _http_client
+
+async def close_http_client():
+    """Close the shared HTTP client (its pooled connections belong to the current event loop)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# Static HTML scanning for the plain-HTTP fast path
+HTML_HREF_PATTERN = re.compile(r'''href\s*=\s*["']([^"']+)["']''', re.IGNORECASE)
+HTML_URL_PATTERN = re.compile(r'''https?://[^\s"'<>\\]+''', re.IGNORECASE)
+HTML_NON_TEXT_PATTERN = re.compile(r'<script\b.*?</script>|<style\b.*?</style>|<[^>]+>', re.IGNORECASE | re.DOTALL)
+
+async def fast_extract_from_website(url: str, client: httpx.AsyncClient) -> Optional[Tuple[Dict[str, str], List[str]]]:
+    """
+    Plain HTTP pass over the landing page HTML, without starting a browser
+    Returns: (social_media_dict, email_list) when the static HTML is enough, otherwise None
+    """
+    try:
+        response = await client.get(url, timeout=15)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning("Fast fetch failed for %s: %s", url, e)
+        return None
+    
+    if 'html' not in response.headers.get('content-type', ''):
+        return None
+    
+    page_html = response.text
+    base_url = str(response.url)
+    social_data = {platform: '' for platform in RobustSocialExtractor.SOCIAL_PATTERNS.keys()}
+    emails = []
+    
+    # Anchors and <link> tags carry the most reliable social links, then any absolute URL
+    # in the markup (og:/meta content, JSON-LD sameAs entries)
+    candidate_links = []
+    for href in HTML_HREF_PATTERN.findall(page_html):
+        href = html.unescape(href).strip()
+        if href.lower().startswith('mailto:'):
+            emails.extend(RobustSocialExtractor.extract_emails_from_text(unquote(href[7:])))
+        else:
+            candidate_links.append(urljoin(base_url, href))
+    candidate_links.extend(html.unescape(link) for link in HTML_URL_PATTERN.findall(page_html))
+    
+    for link in candidate_links:
+        platform = RobustSocialExtractor.platform_for_url(link)
+        if platform and not social_data[platform] and RobustSocialExtractor._is_valid_social_url(link, platform):
+            social_data[platform] = link
+    
+    # Visible text covers @handles and bare profile URLs; raw markup would also match asset names like logo@2x.png
+    page_text = html.unescape(HTML_NON_TEXT_PATTERN.sub(' ', page_html))
+    if not all(social_data.values()):
+        text_social_data = await asyncio.to_thread(RobustSocialExtractor.extract_social_from_text, page_text)
+        for platform, link in text_social_data.items():
+            if link and not social_data[platform]:
+                social_data[platform] = link
+    
+    emails.extend(await asyncio.to_thread(RobustSocialExtractor.extract_emails_from_text, page_text))
+    emails = list(dict.fromkeys(emails))
+    
+    social_count = sum(1 for v in social_data.values() if v)
+    if social_count >= 3 or emails:
+        logger.debug("Fast path found: %s social links, %s emails", social_count, len(emails))
+        return social_data, emails
+    
+    # Not enough in the static HTML (likely rendered client-side), let Playwright handle it
+    return None
+
+async def enhanced_extract_from_website(url: str, page_pool: PagePool) -> Tuple[Dict[str, str], List[str]]:
     """
     Enhanced website extraction for social media links and emails with performance optimizations
     Returns: (social_media_dict, email_list)
@@ -652,198 +1117,574 @@ async def enhanced_extract_from_website(url: str, main_context) -> Tuple[Dict[st
     
     # Extract domain for caching
     try:
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.lower()
-        
-        # Check cache first - if we've already processed this domain, return cached results
-        if domain in WEBSITE_EXTRACTION_CACHE:
-            cached_result = WEBSITE_EXTRACTION_CACHE[domain]
-            print(f"Using cached extraction for domain: {domain}")
-            return cached_result
+        domain = website_cache_key(url)
     except Exception as e:
-        print(f"Error parsing URL for cache check: {e}")
+        logger.warning("Error parsing URL for cache check: %s", e)
         domain = None
+    if not domain:
+        return await crawl_website(url, None, page_pool)
+    
+    # Check cache first - if we've already processed this domain, return cached results
+    cached_result = get_cached_website(domain)
+    if cached_result is not None:
+        logger.debug("Using cached extraction for domain: %s", domain)
+        return cached_result
+    
+    # Businesses sharing a website wait for the crawl that is already running for it
+    entry = WEBSITE_EXTRACTION_IN_FLIGHT.get(domain)
+    if entry is not None:
+        logger.debug("Waiting for in-progress extraction of domain: %s", domain)
+    else:
+        entry = WEBSITE_EXTRACTION_IN_FLIGHT[domain] = [asyncio.ensure_future(crawl_website(url, domain, page_pool)), 0]
+        
+        def forget(_):
+            if WEBSITE_EXTRACTION_IN_FLIGHT.get(domain) is entry:
+                del WEBSITE_EXTRACTION_IN_FLIGHT[domain]
+        entry[0].add_done_callback(forget)
+    
+    crawl = entry[0]
+    entry[1] += 1
+    try:
+        # Shielded so one cancelled waiter does not cancel the crawl for the others
+        return await asyncio.shield(crawl)
+    finally:
+        entry[1] -= 1
+        # Every waiter is gone (the run was stopped), nobody needs the crawl anymore
+        if not entry[1] and not crawl.done():
+            crawl.cancel()
+
+async def cancel_website_crawls():
+    """Cancel the website crawls still running and wait until they have let go of their pages"""
+    crawls = []
+    for crawl, waiters in WEBSITE_EXTRACTION_IN_FLIGHT.values():
+        # Crawls without waiters were cancelled by their last one, a second cancel would cut their cleanup short
+        if waiters:
+            crawl.cancel()
+        crawls.append(crawl)
+    await asyncio.gather(*crawls, return_exceptions=True)
+
+async def crawl_website(url: str, domain: Optional[str], page_pool: PagePool) -> Tuple[Dict[str, str], List[str]]:
+    """Crawl a website for social media links and emails, caching successful results under domain"""
+    parsed_url = urlparse(url)
+    
+    # Try the static HTML first - most sites expose their social links without JavaScript
+    try:
+        fast_result = await fast_extract_from_website(url, get_http_client())
+    except Exception as e:
+        logger.warning("Fast extraction failed for %s: %s", url, e)
+        fast_result = None
+    if fast_result:
+        if domain:
+            cache_website(domain, fast_result)
+        return fast_result
     
     # Initialize results
     social_data = {platform: '' for platform in RobustSocialExtractor.SOCIAL_PATTERNS.keys()}
     emails = []
     visited_urls = set([url])  # Track visited URLs to avoid loops
     
+    # Borrow a page from the run's shared headless browser instead of launching one per website
+    page = await page_pool.acquire()
     try:
-        print(f"Extracting from: {url}")
-        # Create a new browser context for website extraction in headless mode
-        async with async_playwright() as p:
-            website_browser = await p.chromium.launch(headless=True)  # Run website extraction in headless mode
-            website_context = await website_browser.new_context()
-            page = await website_context.new_page()
-            
-            try:
-                # Configure browser for better performance
-                await page.set_extra_http_headers({
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                })
+        logger.debug("Extracting from: %s", url)
+        
+        # Increased timeout for better reliability
+        await page.goto(url, timeout=45000, wait_until='domcontentloaded')
+        await wait_for_network_idle(page, 2000)  # Short wait for dynamic content
+        
+        # Collect icon links, page text, direct links and mailto addresses in one round-trip
+        payload = await page.evaluate('''
+            () => {
+                const payload = { icons: {}, chunks: [], direct: {}, links: [], mailto: [] };
                 
-                # Block unnecessary resources to speed up page loading
-                await page.route('**/*.{png,jpg,jpeg,gif,svg,webp,mp4,webm,mp3,ogg,wav}', lambda route: route.abort())
+                // Enhanced social icon extraction - This is critical for sites that use icon fonts or SVGs
+                try {
+                    const results = payload.icons;
+                    const socialDomains = {
+                        'facebook': ['facebook.com', 'fb.com', 'fb.me'],
+                        'instagram': ['instagram.com', 'instagr.am'],
+                        'twitter': ['twitter.com', 'x.com', 't.co'],
+                        'linkedin': ['linkedin.com'],
+                        'youtube': ['youtube.com', 'youtu.be'],
+                        'tiktok': ['tiktok.com', 'vm.tiktok.com'],
+                        'yelp': ['yelp.com'],
+                        'whatsapp': ['wa.me', 'whatsapp.com'],
+                        'pinterest': ['pinterest.com', 'pin.it']
+                    };
                 
-                # Increased timeout for better reliability
-                await page.goto(url, timeout=45000, wait_until='domcontentloaded')
-                await asyncio.sleep(2)  # Short wait for dynamic content
+                    // Icon classes/attributes commonly used for social media
+                    const iconSelectors = {
+                        'facebook': ['fa-facebook', 'fa-facebook-f', 'fa-facebook-official', 'facebook', 'fb', 'icon-facebook'],
+                        'instagram': ['fa-instagram', 'instagram', 'insta', 'ig', 'icon-instagram'],
+                        'twitter': ['fa-twitter', 'fa-x-twitter', 'twitter', 'tweet', 'icon-twitter'],
+                        'linkedin': ['fa-linkedin', 'fa-linkedin-in', 'linkedin', 'icon-linkedin'],
+                        'youtube': ['fa-youtube', 'fa-youtube-play', 'youtube', 'yt', 'icon-youtube'],
+                        'tiktok': ['fa-tiktok', 'tiktok', 'tt', 'icon-tiktok'],
+                        'yelp': ['fa-yelp', 'yelp', 'icon-yelp'],
+                        'whatsapp': ['fa-whatsapp', 'whatsapp', 'icon-whatsapp'],
+                        'pinterest': ['fa-pinterest', 'fa-pinterest-p', 'pinterest', 'icon-pinterest']
+                    };
                 
-                # Enhanced social icon extraction - This is critical for sites that use icon fonts or SVGs
-                icon_social_links = await page.evaluate('''
-                    () => {
-                        const results = {};
-                        const socialDomains = {
-                            'facebook': ['facebook.com', 'fb.com', 'fb.me'],
-                            'instagram': ['instagram.com', 'instagr.am'],
-                            'twitter': ['twitter.com', 'x.com', 't.co'],
-                            'linkedin': ['linkedin.com'],
-                            'youtube': ['youtube.com', 'youtu.be'],
-                            'tiktok': ['tiktok.com', 'vm.tiktok.com'],
-                            'yelp': ['yelp.com'],
-                            'whatsapp': ['wa.me', 'whatsapp.com'],
-                            'pinterest': ['pinterest.com', 'pin.it']
-                        };
+                    // Find all links
+                    const links = document.querySelectorAll('a[href]');
+                
+                    // Find social links by examining icon classes, attributes, and HTML content
+                    links.forEach(link => {
+                        // Skip if invalid href
+                        if (!link.href || link.href.startsWith('javascript:') || link.href === '#') return;
+                    
+                        // Get all class names as a string
+                        const classNames = Array.from(link.classList).join(' ').toLowerCase();
+                    
+                        // Get inner HTML
+                        const innerHTML = link.innerHTML.toLowerCase();
+                    
+                        // Get aria-label if available (often contains platform name)
+                        const ariaLabel = (link.getAttribute('aria-label') || '').toLowerCase();
+                    
+                        // Get title attribute if available (often contains platform name)
+                        const title = (link.getAttribute('title') || '').toLowerCase();
+                    
+                        // Check if the URL is a social media domain
+                        try {
+                            const url = new URL(link.href);
+                            const hostname = url.hostname.toLowerCase();
                         
-                        // Icon classes/attributes commonly used for social media
-                        const iconSelectors = {
-                            'facebook': ['fa-facebook', 'fa-facebook-f', 'fa-facebook-official', 'facebook', 'fb', 'icon-facebook'],
-                            'instagram': ['fa-instagram', 'instagram', 'insta', 'ig', 'icon-instagram'],
-                            'twitter': ['fa-twitter', 'fa-x-twitter', 'twitter', 'tweet', 'icon-twitter'],
-                            'linkedin': ['fa-linkedin', 'fa-linkedin-in', 'linkedin', 'icon-linkedin'],
-                            'youtube': ['fa-youtube', 'fa-youtube-play', 'youtube', 'yt', 'icon-youtube'],
-                            'tiktok': ['fa-tiktok', 'tiktok', 'tt', 'icon-tiktok'],
-                            'yelp': ['fa-yelp', 'yelp', 'icon-yelp'],
-                            'whatsapp': ['fa-whatsapp', 'whatsapp', 'icon-whatsapp'],
-                            'pinterest': ['fa-pinterest', 'fa-pinterest-p', 'pinterest', 'icon-pinterest']
-                        };
+                            // Direct domain match (highest confidence)
+                            for (const [platform, domains] of Object.entries(socialDomains)) {
+                                if (domains.some(domain => hostname.includes(domain))) {
+                                    results[platform] = link.href;
+                                    continue;
+                                }
+                            }
+                        } catch (e) {
+                            // Invalid URL, continue with other checks
+                        }
+                    
+                        // For each social platform, check if this link might be for it
+                        for (const [platform, keywords] of Object.entries(iconSelectors)) {
+                            // Skip if we already found this platform
+                            if (results[platform]) continue;
                         
-                        // Find all links
-                        const links = document.querySelectorAll('a[href]');
+                            // Check if any keyword matches in classes, innerHTML, aria-label, or title
+                            const matchesKeyword = keywords.some(keyword => 
+                                classNames.includes(keyword) || 
+                                innerHTML.includes(keyword) || 
+                                ariaLabel.includes(keyword) || 
+                                title.includes(keyword)
+                            );
                         
-                        // Find social links by examining icon classes, attributes, and HTML content
-                        links.forEach(link => {
-                            // Skip if invalid href
-                            if (!link.href || link.href.startsWith('javascript:') || link.href === '#') return;
+                            if (matchesKeyword) {
+                                // Check for icon elements inside the link
+                                const iconElement = link.querySelector('i, span.icon, .svg-icon, [class*="icon"], [class*="social"], svg');
                             
-                            // Get all class names as a string
-                            const classNames = Array.from(link.classList).join(' ').toLowerCase();
-                            
-                            // Get inner HTML
-                            const innerHTML = link.innerHTML.toLowerCase();
-                            
-                            // Get aria-label if available (often contains platform name)
-                            const ariaLabel = (link.getAttribute('aria-label') || '').toLowerCase();
-                            
-                            // Get title attribute if available (often contains platform name)
-                            const title = (link.getAttribute('title') || '').toLowerCase();
-                            
-                            // Check if the URL is a social media domain
+                                if (iconElement) {
+                                    const iconClasses = Array.from(iconElement.classList).join(' ').toLowerCase();
+                                
+                                    // Check if icon has a platform-specific class
+                                    const hasIconClass = keywords.some(keyword => iconClasses.includes(keyword));
+                                
+                                    if (hasIconClass || matchesKeyword) {
+                                        results[platform] = link.href;
+                                    }
+                                } else if (matchesKeyword) {
+                                    // Even without an icon element, if link strongly suggests a platform
+                                    results[platform] = link.href;
+                                }
+                            }
+                        }
+                    });
+                } catch (e) {
+                    // Keep whatever the other sections collected
+                }
+                
+                // Get all text content including meta tags and link tags as short chunks
+                // so the Python side never has to materialize one multi-MB string
+                try {
+                    const chunks = payload.chunks;
+                    const maxChunkLength = 4000;
+                    // Cap the visible text shipped back over CDP, contact details sit well within it
+                    const maxTextLength = 200000;
+                    let textLength = 0;
+                    let buffer = [];
+                    let bufferLength = 0;
+                    
+                    const flush = () => {
+                        if (!bufferLength) return;
+                        textLength += bufferLength;
+                        const chunk = buffer.join(' ').replace(/\\s+/g, ' ').trim();
+                        if (chunk) chunks.push(chunk);
+                        buffer = [];
+                        bufferLength = 0;
+                    };
+                    
+                    // Walk visible text nodes, flushing a chunk every few KB; text repeated by
+                    // sticky headers and duplicate mobile menus is only collected once
+                    const seenText = new Set();
+                    const walked = new Set();
+                    const collectText = (el) => {
+                        if (!el || walked.has(el)) return;
+                        walked.add(el);
+                        for (const node of el.childNodes) {
+                            if (textLength >= maxTextLength) return;
+                            if (node.nodeType === 3) {
+                                const value = node.textContent;
+                                const key = value.trim();
+                                if (!key || seenText.has(key)) continue;
+                                seenText.add(key);
+                                buffer.push(value);
+                                bufferLength += value.length;
+                                if (bufferLength >= maxChunkLength) flush();
+                            } else if (node.nodeType === 1) {
+                                const style = window.getComputedStyle(node);
+                                if (style.display === 'none' || style.visibility === 'hidden') continue;
+                                collectText(node);
+                            }
+                        }
+                    };
+                    // Social links and contact details usually sit in the header and footer, so they
+                    // go in the first chunks and the scan can stop before reaching the page body
+                    document.querySelectorAll('header, nav, footer').forEach(el => {
+                        const style = window.getComputedStyle(el);
+                        if (style.display !== 'none' && style.visibility !== 'hidden') collectText(el);
+                    });
+                    flush();
+                    collectText(document.body);
+                    flush();
+                
+                    // Get all meta tags content
+                    const metaContent = Array.from(document.getElementsByTagName('meta'))
+                        .map(meta => meta.content)
+                        .filter(Boolean)
+                        .join(' ');
+                    if (metaContent) chunks.push(metaContent);
+                
+                    // Get all link tags content
+                    const linkContent = Array.from(document.getElementsByTagName('link'))
+                        .map(link => link.href)
+                        .filter(Boolean)
+                        .join(' ');
+                    if (linkContent) chunks.push(linkContent);
+                } catch (e) {
+                    // Keep whatever the other sections collected
+                }
+                
+                // Enhanced link extraction from HTML with direct social media detection
+                try {
+                    const results = payload.direct;
+                    const links = new Set();
+                
+                    // Define domain patterns for social platforms
+                    const socialDomains = {
+                        'facebook': ['facebook.com', 'fb.com', 'fb.me'],
+                        'instagram': ['instagram.com', 'instagr.am'],
+                        'twitter': ['twitter.com', 'x.com', 't.co'],
+                        'linkedin': ['linkedin.com'],
+                        'youtube': ['youtube.com', 'youtu.be'],
+                        'tiktok': ['tiktok.com', 'vm.tiktok.com'],
+                        'yelp': ['yelp.com'],
+                        'whatsapp': ['wa.me', 'whatsapp.com'],
+                        'pinterest': ['pinterest.com', 'pin.it']
+                    };
+                
+                    // Get all links
+                    const anchors = document.querySelectorAll('a[href]');
+                    anchors.forEach(anchor => {
+                        let href = anchor.href;
+                        if (href && !href.startsWith('javascript:') && !href.startsWith('mailto:') && !href.startsWith('tel:')) {
                             try {
-                                const url = new URL(link.href);
+                                const url = new URL(href);
                                 const hostname = url.hostname.toLowerCase();
-                                
-                                // Direct domain match (highest confidence)
+                            
+                                // Check if it's a social media link
                                 for (const [platform, domains] of Object.entries(socialDomains)) {
                                     if (domains.some(domain => hostname.includes(domain))) {
-                                        results[platform] = link.href;
-                                        continue;
+                                        results[platform] = url.href;
                                     }
                                 }
+                            
+                                // Add to general links
+                                links.add(url.href);
                             } catch (e) {
-                                // Invalid URL, continue with other checks
+                                // Skip invalid URLs
+                            }
+                        }
+                    });
+                
+                    // Get social from JSON-LD (highly reliable)
+                    const scripts = document.querySelectorAll('script[type="application/ld+json"]');
+                    scripts.forEach(script => {
+                        try {
+                            const data = JSON.parse(script.textContent);
+                            if (data.sameAs && Array.isArray(data.sameAs)) {
+                                data.sameAs.forEach(url => {
+                                    try {
+                                        const parsedUrl = new URL(url);
+                                        const hostname = parsedUrl.hostname.toLowerCase();
+                                    
+                                        for (const [platform, domains] of Object.entries(socialDomains)) {
+                                            if (domains.some(domain => hostname.includes(domain))) {
+                                                results[platform] = url;
+                                            }
+                                        }
+                                    } catch (e) {
+                                        // Skip invalid URLs
+                                    }
+                                });
                             }
+                        } catch (e) {
+                            // Skip invalid JSON
+                        }
+                    });
+                
+                    // Find social media in social icons (very reliable)
+                    const socialSelectors = [
+                        '.social a', '.social-media a', '.social-links a',
+                        '[class*="social"] a', '[id*="social"] a',
+                        'footer a', '.footer a', '[class*="footer"] a'
+                    ];
+                
+                    socialSelectors.forEach(selector => {
+                        document.querySelectorAll(selector).forEach(el => {
+                            const href = el.href;
+                            if (!href || href.startsWith('javascript:')) return;
+                        
+                            try {
+                                const url = new URL(href);
+                                const hostname = url.hostname.toLowerCase();
                             
-                            // For each social platform, check if this link might be for it
-                            for (const [platform, keywords] of Object.entries(iconSelectors)) {
-                                // Skip if we already found this platform
-                                if (results[platform]) continue;
+                                for (const [platform, domains] of Object.entries(socialDomains)) {
+                                    // Check URL domain
+                                    if (domains.some(domain => hostname.includes(domain))) {
+                                        results[platform] = url.href;
+                                    }
                                 
-                                // Check if any keyword matches in classes, innerHTML, aria-label, or title
-                                const matchesKeyword = keywords.some(keyword => 
-                                    classNames.includes(keyword) || 
-                                    innerHTML.includes(keyword) || 
-                                    ariaLabel.includes(keyword) || 
-                                    title.includes(keyword)
-                                );
+                                    // Check element classes and content
+                                    const elContent = el.innerHTML.toLowerCase();
+                                    if (elContent.includes(platform) || 
+                                        Array.from(el.classList).some(c => c.toLowerCase().includes(platform))) {
+                                        for (const domain of domains) {
+                                            if (hostname.includes(domain)) {
+                                                results[platform] = url.href;
+                                                break;
+                                            }
+                                        }
+                                    }
                                 
-                                if (matchesKeyword) {
-                                    // Check for icon elements inside the link
-                                    const iconElement = link.querySelector('i, span.icon, .svg-icon, [class*="icon"], [class*="social"], svg');
+                                    // Check for icons
+                                    const img = el.querySelector('img, svg');
+                                    if (img) {
+                                        const alt = img.alt || '';
+                                        const src = img.src || '';
+                                        const classes = Array.from(img.classList).join(' ');
                                     
-                                    if (iconElement) {
-                                        const iconClasses = Array.from(iconElement.classList).join(' ').toLowerCase();
-                                        
-                                        // Check if icon has a platform-specific class
-                                        const hasIconClass = keywords.some(keyword => iconClasses.includes(keyword));
-                                        
-                                        if (hasIconClass || matchesKeyword) {
-                                            results[platform] = link.href;
+                                        if (alt.toLowerCase().includes(platform) || 
+                                            src.toLowerCase().includes(platform) ||
+                                            classes.toLowerCase().includes(platform)) {
+                                            results[platform] = url.href;
                                         }
-                                    } else if (matchesKeyword) {
-                                        // Even without an icon element, if link strongly suggests a platform
-                                        results[platform] = link.href;
                                     }
                                 }
+                            } catch (e) {
+                                // Skip invalid URLs
                             }
                         });
-                        
-                        return results;
-                    }
-                ''')
+                    });
                 
-                # Process icon-based social links (high confidence)
-                for platform_lower, link in icon_social_links.items():
-                    platform = platform_lower.capitalize()
-                    if platform in social_data and link and RobustSocialExtractor._is_valid_social_url(link, platform):
-                        social_data[platform] = link
+                    payload.links = Array.from(links);
+                } catch (e) {
+                    // Keep whatever the other sections collected
+                }
                 
-                # Get all text content including meta tags and link tags
-                all_text = await page.evaluate('''
-                    () => {
-                        // Get all text content
-                        const getText = (el) => {
-                            if (!el) return '';
-                            return Array.from(el.childNodes)
-                                .map(node => {
-                                    if (node.nodeType === 3) return node.textContent;
-                                    if (node.nodeType === 1) {
-                                        const style = window.getComputedStyle(node);
-                                        if (style.display === 'none' || style.visibility === 'hidden') return '';
-                                        return getText(node);
-                                    }
-                                    return '';
-                                })
-                                .join(' ')
-                                .replace(/\\s+/g, ' ')
-                                .trim();
-                        };
-                        
-                        // Get all meta tags content
-                        const metaContent = Array.from(document.getElementsByTagName('meta'))
-                            .map(meta => meta.content)
-                            .join(' ');
-                        
-                        // Get all link tags content
-                        const linkContent = Array.from(document.getElementsByTagName('link'))
-                            .map(link => link.href)
-                            .join(' ');
-                        
-                        return getText(document.body) + ' ' + metaContent + ' ' + linkContent;
-                    }
-                ''')
+                // Also check for mailto links
+                try {
+                    const mailtoLinks = document.querySelectorAll('a[href^="mailto:"]');
+                    payload.mailto = Array.from(mailtoLinks).map(link => link.href.replace('mailto:', '')).filter(email => email.includes('@'));
+                } catch (e) {
+                    // Keep whatever the other sections collected
+                }
                 
-                # Enhanced link extraction from HTML with direct social media detection
-                direct_social_links = await page.evaluate('''
-                    () => {
-                        const results = {};
-                        const links = new Set();
-                        
-                        // Define domain patterns for social platforms
-                        const socialDomains = {
-                            'facebook': ['facebook.com', 'fb.com', 'fb.me'],
-                            'instagram': ['instagram.com', 'instagr.am'],
+                return payload;
+            }
+        ''')
+        icon_social_links = payload.get('icons') or {}
+        text_chunks = payload.get('chunks') or []
+        direct_social_links = payload.get('direct') or {}
+        mailto_links = payload.get('mailto') or []
+        
+        # Process icon-based social links (high confidence)
+        for platform_lower, link in icon_social_links.items():
+            platform = platform_lower.capitalize()
+            if platform in social_data and link and RobustSocialExtractor._is_valid_social_url(link, platform):
+                social_data[platform] = link
+        
+        # Process direct social links first (most reliable)
+        for platform_lower, link in direct_social_links.items():
+            platform = platform_lower.capitalize()
+            if platform in social_data and link and RobustSocialExtractor._is_valid_social_url(link, platform):
+                social_data[platform] = link
+        
+        def scan_text_chunks():
+            """Scan the page text chunk by chunk; stop looking for social links once every platform is filled"""
+            chunk_emails = []
+            for chunk in text_chunks:
+                if not all(social_data.values()):
+                    text_social_data = RobustSocialExtractor.extract_social_from_text(chunk)
+                    
+                    # Merge with existing social data (don't overwrite direct findings)
+                    for platform, link in text_social_data.items():
+                        if link and not social_data.get(platform):
+                            social_data[platform] = link
+                
+                # Extract emails using enhanced method
+                chunk_emails.extend(RobustSocialExtractor.extract_emails_from_text(chunk))
+            return chunk_emails
+        
+        # All chunks are scanned in a single worker thread call
+        emails.extend(await asyncio.to_thread(scan_text_chunks))
+        
+        # mailto hrefs can carry ?subject= and percent-encoding, so they go through the same patterns
+        for email in mailto_links:
+            emails.extend(RobustSocialExtractor.extract_emails_from_text(unquote(email)))
+        
+        # Check if we need to explore more pages
+        social_count = sum(1 for v in social_data.values() if v)
+        
+        # Only explore secondary pages if we haven't found many social links on the main page
+        # and if we found at least 1 email or social link on the main page (to confirm it's a valid business site)
+        main_page_has_valid_data = social_count > 0 or len(emails) > 0
+        
+        if social_count < 4 and main_page_has_valid_data:
+            # Important pages to check - limit to top 3 most likely pages to have social links
+            priority_paths = [
+                '/contact', 
+                '/about',
+                '/social'
+            ]
+            
+            # Get the base URL
+            base_url = parsed_url.scheme + '://' + parsed_url.netloc
+            
+            # Keep track of how many pages we've checked
+            pages_checked = 0
+            max_pages_to_check = 2  # Limit to checking only 2 secondary pages
+            
+            # Check each important path
+            for path in priority_paths:
+                # Stop if we've found enough social links or checked enough pages
+                if sum(1 for v in social_data.values() if v) >= 4 or pages_checked >= max_pages_to_check:
+                    break
+                    
+                page_url = urljoin(base_url, path)
+                if page_url in visited_urls:
+                    continue
+                
+                visited_urls.add(page_url)
+                pages_checked += 1
+                
+                try:
+                    # Use a shorter timeout for these secondary pages
+                    await page.goto(page_url, timeout=20000, wait_until='domcontentloaded')
+                    await wait_for_network_idle(page, 1000)
+                    
+                    # Extract page text, direct social links and mailto addresses in one round-trip
+                    page_payload = await page.evaluate('''
+                        () => {
+                            const payload = { text: '', direct: {}, mailto: [] };
+                            
+                            try {
+                                payload.text = document.body.innerText.slice(0, 200000);
+                            } catch (e) {
+                                // Keep whatever the other sections collected
+                            }
+                            
+                            try {
+                                const results = payload.direct;
+                                const socialDomains = {
+                                    'facebook': ['facebook.com', 'fb.com', 'fb.me'],
+                                    'instagram': ['instagram.com', 'instagr.am'],
+                                    'twitter': ['twitter.com', 'x.com', 't.co'],
+                                    'linkedin': ['linkedin.com'],
+                                    'youtube': ['youtube.com', 'youtu.be'],
+                                    'tiktok': ['tiktok.com', 'vm.tiktok.com'],
+                                    'yelp': ['yelp.com'],
+                                    'whatsapp': ['wa.me', 'whatsapp.com'],
+                                    'pinterest': ['pinterest.com', 'pin.it']
+                                };
+                                
+                                document.querySelectorAll('a[href]').forEach(anchor => {
+                                    try {
+                                        const href = anchor.href;
+                                        if (!href || href.startsWith('javascript:')) return;
+                                        
+                                        const url = new URL(href);
+                                        const hostname = url.hostname.toLowerCase();
+                                        
+                                        for (const [platform, domains] of Object.entries(socialDomains)) {
+                                            if (domains.some(domain => hostname.includes(domain))) {
+                                                results[platform] = url.href;
+                                            }
+                                        }
+                                    } catch (e) {
+                                        // Skip invalid URLs
+                                    }
+                                });
+                            } catch (e) {
+                                // Keep whatever the other sections collected
+                            }
+                            
+                            try {
+                                const links = document.querySelectorAll('a[href^="mailto:"]');
+                                payload.mailto = Array.from(links).map(link => link.href.replace('mailto:', '')).filter(email => email.includes('@'));
+                            } catch (e) {
+                                // Keep whatever the other sections collected
+                            }
+                            
+                            return payload;
+                        }
+                    ''')
+                    page_text = page_payload.get('text') or ''
+                    page_direct_social = page_payload.get('direct') or {}
+                    page_mailto = page_payload.get('mailto') or []
+                    
+                    # Find social links in this page
+                    page_social = await asyncio.to_thread(RobustSocialExtractor.extract_social_from_text, page_text)
+                    
+                    # Process direct social links
+                    for platform_lower, link in page_direct_social.items():
+                        platform = platform_lower.capitalize()
+                        if platform in social_data and link and not social_data.get(platform):
+                            if RobustSocialExtractor._is_valid_social_url(link, platform):
+                                social_data[platform] = link
+                    
+                    # Add text-extracted social links
+                    for platform, link in page_social.items():
+                        if link and not social_data.get(platform):
+                            social_data[platform] = link
+                    
+                    # Extract any additional emails
+                    page_emails = await asyncio.to_thread(RobustSocialExtractor.extract_emails_from_text, page_text)
+                    emails.extend(page_emails)
+                    
+                    for email in page_mailto:
+                        emails.extend(RobustSocialExtractor.extract_emails_from_text(unquote(email)))
+                
+                except Exception as e:
+                    # Just continue to the next page if there's an error
+                    continue
+            
+            # Check footer links directly on the main page
+            try:
+                # Go back to the main page
+                await page.goto(url, timeout=20000, wait_until='domcontentloaded')
+                
+                # Look specifically at footer links
+                footer_social = await page.evaluate('''
+                    () => {
+                        const results = {};
+                        const socialDomains = {
+                            'facebook': ['facebook.com', 'fb.com', 'fb.me'],
+                            'instagram': ['instagram.com', 'instagr.am'],
                             'twitter': ['twitter.com', 'x.com', 't.co'],
                             'linkedin': ['linkedin.com'],
                             'youtube': ['youtube.com', 'youtu.be'],
@@ -853,103 +1694,23 @@ async def enhanced_extract_from_website(url: str, main_context) -> Tuple[Dict[st
                             'pinterest': ['pinterest.com', 'pin.it']
                         };
                         
-                        // Get all links
-                        const anchors = document.querySelectorAll('a[href]');
-                        anchors.forEach(anchor => {
-                            let href = anchor.href;
-                            if (href && !href.startsWith('javascript:') && !href.startsWith('mailto:') && !href.startsWith('tel:')) {
-                                try {
-                                    const url = new URL(href);
-                                    const hostname = url.hostname.toLowerCase();
-                                    
-                                    // Check if it's a social media link
-                                    for (const [platform, domains] of Object.entries(socialDomains)) {
-                                        if (domains.some(domain => hostname.includes(domain))) {
-                                            results[platform] = url.href;
-                                        }
-                                    }
-                                    
-                                    // Add to general links
-                                    links.add(url.href);
-                                } catch (e) {
-                                    // Skip invalid URLs
-                                }
-                            }
-                        });
-                        
-                        // Get social from JSON-LD (highly reliable)
-                        const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-                        scripts.forEach(script => {
-                            try {
-                                const data = JSON.parse(script.textContent);
-                                if (data.sameAs && Array.isArray(data.sameAs)) {
-                                    data.sameAs.forEach(url => {
-                                        try {
-                                            const parsedUrl = new URL(url);
-                                            const hostname = parsedUrl.hostname.toLowerCase();
-                                            
-                                            for (const [platform, domains] of Object.entries(socialDomains)) {
-                                                if (domains.some(domain => hostname.includes(domain))) {
-                                                    results[platform] = url;
-                                                }
-                                            }
-                                        } catch (e) {
-                                            // Skip invalid URLs
-                                        }
-                                    });
-                                }
-                            } catch (e) {
-                                // Skip invalid JSON
-                            }
-                        });
-                        
-                        // Find social media in social icons (very reliable)
-                        const socialSelectors = [
-                            '.social a', '.social-media a', '.social-links a',
-                            '[class*="social"] a', '[id*="social"] a',
-                            'footer a', '.footer a', '[class*="footer"] a'
-                        ];
+                        // Look for footer elements
+                        const footers = document.querySelectorAll('footer, .footer, [class*="footer"], [id*="footer"]');
                         
-                        socialSelectors.forEach(selector => {
-                            document.querySelectorAll(selector).forEach(el => {
-                                const href = el.href;
-                                if (!href || href.startsWith('javascript:')) return;
-                                
+                        footers.forEach(footer => {
+                            const links = footer.querySelectorAll('a[href]');
+                            links.forEach(link => {
                                 try {
+                                    const href = link.href;
+                                    if (!href || href.startsWith('javascript:')) return;
+                                    
                                     const url = new URL(href);
                                     const hostname = url.hostname.toLowerCase();
                                     
                                     for (const [platform, domains] of Object.entries(socialDomains)) {
-                                        // Check URL domain
                                         if (domains.some(domain => hostname.includes(domain))) {
                                             results[platform] = url.href;
                                         }
-                                        
-                                        // Check element classes and content
-                                        const elContent = el.innerHTML.toLowerCase();
-                                        if (elContent.includes(platform) || 
-                                            Array.from(el.classList).some(c => c.toLowerCase().includes(platform))) {
-                                            for (const domain of domains) {
-                                                if (hostname.includes(domain)) {
-                                                    results[platform] = url.href;
-                                                    break;
-                                                }
-                                            }
-                                        }
-                                        
-                                        // Check for icons
-                                        const img = el.querySelector('img, svg');
-                                        if (img) {
-                                            const alt = img.alt || '';
-                                            const src = img.src || '';
-                                            const classes = Array.from(img.classList).join(' ');
-                                            
-                                            if (alt.toLowerCase().includes(platform) || 
-                                                src.toLowerCase().includes(platform) ||
-                                                classes.toLowerCase().includes(platform)) {
-                                                results[platform] = url.href;
-                                            }
-                                        }
                                     }
                                 } catch (e) {
                                     // Skip invalid URLs
@@ -957,902 +1718,945 @@ async def enhanced_extract_from_website(url: str, main_context) -> Tuple[Dict[st
                             });
                         });
                         
-                        return {
-                            directSocial: results,
-                            allLinks: Array.from(links)
-                        };
+                        return results;
                     }
                 ''')
                 
-                # Process direct social links first (most reliable)
-                for platform_lower, link in direct_social_links['directSocial'].items():
+                # Process footer social links
+                for platform_lower, link in footer_social.items():
                     platform = platform_lower.capitalize()
-                    if platform in social_data and link and RobustSocialExtractor._is_valid_social_url(link, platform):
-                        social_data[platform] = link
-                
-                # Extract social media links using enhanced extractor
-                text_social_data = RobustSocialExtractor.extract_social_from_text(all_text)
-                
-                # Merge with existing social data (don't overwrite direct findings)
-                for platform, link in text_social_data.items():
-                    if link and not social_data.get(platform):
-                        social_data[platform] = link
-                
-                # Extract emails using enhanced method
-                extracted_emails = RobustSocialExtractor.extract_emails_from_text(all_text)
-                emails.extend(extracted_emails)
-                
-                # Also check for mailto links
-                mailto_links = await page.evaluate('''
-                    () => {
-                        const mailtoLinks = document.querySelectorAll('a[href^="mailto:"]');
-                        return Array.from(mailtoLinks).map(link => link.href.replace('mailto:', '')).filter(email => email.includes('@'));
-                    }
-                ''')
-                
-                for email in mailto_links:
-                    if RobustSocialExtractor._is_valid_email(email.lower()):
-                        emails.append(email.lower())
-                
-                # Check if we need to explore more pages
-                social_count = sum(1 for v in social_data.values() if v)
+                    if platform in social_data and link and not social_data.get(platform):
+                        if RobustSocialExtractor._is_valid_social_url(link, platform):
+                            social_data[platform] = link
+                            
+            except Exception as e:
+                pass  # Silent error
+        
+        # Remove duplicates from emails, keeping the order they were found in
+        emails = list(dict.fromkeys(emails))
+        
+        final_social_count = sum(1 for v in social_data.values() if v)
+        logger.debug("Found: %s social links, %s emails", final_social_count, len(emails))
+        
+        # Store in cache if we have a valid domain
+        if domain:
+            cache_website(domain, (social_data, emails))
+            
+        return social_data, emails
+        
+    except Exception as e:
+        logger.warning("Error during extraction from %s: %s", url, e)
+        return social_data, emails
+    finally:
+        await page_pool.release(page)
+
+async def enrich_with_website(business_data, page_pool: PagePool, semaphore: asyncio.Semaphore):
+    """Merge the social links and emails found on the business website into business_data."""
+    website = business_data['Website']
+    async with semaphore:
+        logger.debug('Enhanced extraction from website: %s', website)
+        try:
+            website_social_data, website_emails = await enhanced_extract_from_website(website, page_pool)
+        except Exception as e:
+            logger.warning('Error in website extraction: %s', e)
+            return
+    
+    # Merge social media data (Google Maps links take precedence)
+    for platform, link in website_social_data.items():
+        if link and not business_data.get(platform):
+            business_data[platform] = link
+    
+    # Use the first website email when Google Maps had none
+    if not business_data['Email'] and website_emails:
+        business_data['Email'] = website_emails[0]
+
+async def fetch_all_websites(records, page_pool: PagePool, semaphore: Optional[asyncio.Semaphore] = None):
+    """Enrich records from their websites concurrently, at most WEBSITE_CRAWL_CONCURRENCY at a time."""
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(WEBSITE_CRAWL_CONCURRENCY)
+    await asyncio.gather(*(enrich_with_website(record, page_pool, semaphore) for record in records))
+
+async def extract_panel_fields(page, all_text) -> Dict[str, str]:
+    """Manual extraction of the business fields from the open Google Maps panel, keyed like the Gemini result"""
+    # Read every panel field in one round-trip
+    panel = await page.evaluate('''
+        () => {
+            // First matching element with visible text, like the old per-field lookups
+            const firstText = (selector) => {
+                for (const el of document.querySelectorAll(selector)) {
+                    const text = (el.innerText || '').trim();
+                    if (text) return text;
+                }
+                return '';
+            };
+            const mailto = document.querySelector('a[href^="mailto:"]');
+            return {
+                name: firstText('h1, .fontHeadlineLarge, .DUwDvf, [data-item-id="title"]'),
+                businessType: firstText('.fontBodyMedium button[jsaction*="pane.rating.category"], .skqShb'),
+                address: firstText('[data-item-id="address"], .rogA2c, .Io6YTe.fontBodyMedium, .LrzXr'),
+                phone: firstText('[data-item-id="phone"], .Io6YTe.fontBodyMedium, .UsdlK'),
+                websites: Array.from(document.querySelectorAll('a[data-item-id="authority"], a[aria-label*="Website"], .rogA2c a, .Io6YTe a'))
+                    .map(el => el.getAttribute('href')),
+                mailto: mailto ? mailto.getAttribute('href') : ''
+            };
+        }
+    ''')
+    name = panel.get('name', '')
+    business_type = panel.get('businessType', '')
+    address = panel.get('address', '')
+    phone = panel.get('phone', '')
+    
+    # Extract opening and closing times
+    opening_time = ''
+    closing_time = ''
+    business_hours = ''
+    
+    # Try to extract the hours information
+    hours_data = await page.evaluate('''
+        () => {
+            try {
+                // Find the hours container with more comprehensive selectors
+                const hoursContainer = document.querySelector('[data-item-id="oh"], .y0skZc, .t39EBf, [aria-label*="hour"], [aria-label*="open"], .IDyq0e, [data-ved][jsaction][role="button"][data-url*="hour"], .OMl5r');
+            
+                if (hoursContainer) {
+                    // First check if today's hours are shown
+                    const todayHours = document.querySelector('.fontBodyMedium[aria-label*="open"], .fontBodyMedium[aria-label*="close"], .ZDu9vd, .y0skZc, .OMl5r');
                 
-                # Only explore secondary pages if we haven't found many social links on the main page
-                # and if we found at least 1 email or social link on the main page (to confirm it's a valid business site)
-                main_page_has_valid_data = social_count > 0 or len(emails) > 0
+                    let openingTime = '';
+                    let closingTime = '';
+                    let workingHours = '';
                 
-                if social_count < 4 and main_page_has_valid_data:
-                    # Important pages to check - limit to top 3 most likely pages to have social links
-                    priority_paths = [
-                        '/contact', 
-                        '/about',
-                        '/social'
-                    ]
+                    if (todayHours) {
+                        const hoursText = todayHours.textContent.trim();
+                        workingHours = hoursText;
                     
-                    # Get the base URL
-                    base_url = parsed_url.scheme + '://' + parsed_url.netloc
+                        // Extract hours using regex
+                        const hoursMatch = hoursText.match(/(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/);
                     
-                    # Keep track of how many pages we've checked
-                    pages_checked = 0
-                    max_pages_to_check = 2  # Limit to checking only 2 secondary pages
+                        if (hoursMatch) {
+                            openingTime = hoursMatch[1].trim();
+                            closingTime = hoursMatch[2].trim();
+                        } else {
+                            // Try another regex pattern for "Opens at X"
+                            const opensMatch = hoursText.match(/Opens\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/i);
+                            if (opensMatch) {
+                                openingTime = opensMatch[1].trim();
+                            }
+                        
+                            // Try another pattern for "Closes at X"
+                            const closesMatch = hoursText.match(/Closes\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/i);
+                            if (closesMatch) {
+                                closingTime = closesMatch[1].trim();
+                            }
+                        }
                     
-                    # Check each important path
-                    for path in priority_paths:
-                        # Stop if we've found enough social links or checked enough pages
-                        if sum(1 for v in social_data.values() if v) >= 4 or pages_checked >= max_pages_to_check:
-                            break
-                            
-                        page_url = urljoin(base_url, path)
-                        if page_url in visited_urls:
-                            continue
+                        // Check for special cases
+                        if (hoursText.includes('24 hours') || hoursText.includes('Open 24 hours')) {
+                            openingTime = '12:00 AM';
+                            closingTime = '11:59 PM';
+                            workingHours = 'Open 24 hours';
+                        } else if (hoursText.includes('Closed')) {
+                            workingHours = 'Closed';
+                        }
+                    }
+                
+                    // Always return shouldClick: true to get the full weekly schedule
+                    return {
+                        opening: openingTime,
+                        closing: closingTime,
+                        workingHours: workingHours,
+                        shouldClick: true // Always click to get full schedule
+                    };
+                }
+            
+                // If no hours container found, still try to click for hours
+                return { opening: '', closing: '', workingHours: '', shouldClick: true };
+            } catch (e) {
+                console.error('Error in initial hours detection:', e);
+                return { opening: '', closing: '', workingHours: '', shouldClick: true };
+            }
+        }
+    ''')
+    
+    # Initialize business hours
+    business_hours = ''
+    
+    # If we need to click the hours button to get more information
+    if hours_data.get('shouldClick', False):
+        try:
+            # Click on hours button if it exists
+            hours_button = await page.query_selector('[data-item-id="oh"], .y0skZc, .t39EBf, [aria-label*="hour"], [aria-label*="open"], .IDyq0e, [data-ved][jsaction][role="button"][data-url*="hour"]')
+            if hours_button:
+                await hours_button.click()
+                try:
+                    await page.wait_for_selector('.dRgULb, [aria-label*="hour"] div[jsaction*="pane.openhours"], div[role="region"][aria-label*="hour"], .t39EBf, .MmmeYe', timeout=2000)
+                except Exception:
+                    pass  # The evaluate below copes with a missing schedule
+            
+                # Extract hours from the expanded view
+                expanded_hours = await page.evaluate('''
+                    () => {
+                        try {
+                            // Find the hours container with more comprehensive selectors
+                            const daysContainer = document.querySelector('.dRgULb, [aria-label*="hour"] div[jsaction*="pane.openhours"], div[role="region"][aria-label*="hour"], .t39EBf, .MmmeYe');
+                            if (!daysContainer) return { opening: '', closing: '', workingHours: '' };
                         
-                        visited_urls.add(page_url)
-                        pages_checked += 1
+                            // Get today's date info for finding current day
+                            const today = new Date().toLocaleDateString('en-US', { weekday: 'long' });
                         
-                        try:
-                            # Use a shorter timeout for these secondary pages
-                            await page.goto(page_url, timeout=20000, wait_until='domcontentloaded')
-                            await asyncio.sleep(1)
-                            
-                            # Extract page content
-                            page_text = await page.evaluate('() => document.body.innerText')
+                            // More comprehensive selector for day rows
+                            const dayRows = Array.from(daysContainer.querySelectorAll('tr, [role="row"], .mWUmld, .y0skZc div, div[jsaction*="pane.openhours"] div, .t39EBf div, .MmmeYe div'));
+                        
+                            // Days of the week for standardizing output
+                            const daysOfWeek = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'];
+                        
+                            // Build full working hours schedule with better formatting
+                            const fullSchedule = [];
+                            const formattedSchedule = {};
+                            let openingTime = '';
+                            let closingTime = '';
+                            let targetRow = null;
+                        
+                            // Process each day row
+                            for (const row of dayRows) {
+                                const rowText = row.textContent.trim();
                             
-                            # Find social links in this page
-                            page_social = RobustSocialExtractor.extract_social_from_text(page_text)
+                                // Skip rows without day information
+                                if (!daysOfWeek.some(day => rowText.includes(day))) {
+                                    continue;
+                                }
                             
-                            # Extract direct social links
-                            page_direct_social = await page.evaluate('''
-                                () => {
-                                    const results = {};
-                                    const socialDomains = {
-                                        'facebook': ['facebook.com', 'fb.com', 'fb.me'],
-                                        'instagram': ['instagram.com', 'instagr.am'],
-                                        'twitter': ['twitter.com', 'x.com', 't.co'],
-                                        'linkedin': ['linkedin.com'],
-                                        'youtube': ['youtube.com', 'youtu.be'],
-                                        'tiktok': ['tiktok.com', 'vm.tiktok.com'],
-                                        'yelp': ['yelp.com'],
-                                        'whatsapp': ['wa.me', 'whatsapp.com'],
-                                        'pinterest': ['pinterest.com', 'pin.it']
-                                    };
-                                    
-                                    document.querySelectorAll('a[href]').forEach(anchor => {
-                                        try {
-                                            const href = anchor.href;
-                                            if (!href || href.startsWith('javascript:')) return;
-                                            
-                                            const url = new URL(href);
-                                            const hostname = url.hostname.toLowerCase();
-                                            
-                                            for (const [platform, domains] of Object.entries(socialDomains)) {
-                                                if (domains.some(domain => hostname.includes(domain))) {
-                                                    results[platform] = url.href;
-                                                }
-                                            }
-                                        } catch (e) {
-                                            // Skip invalid URLs
-                                        }
-                                    });
-                                    
-                                    return results;
+                                // Determine which day this row represents
+                                let currentDay = '';
+                                for (const day of daysOfWeek) {
+                                    if (rowText.includes(day)) {
+                                        currentDay = day;
+                                        break;
+                                    }
                                 }
-                            ''')
                             
-                            # Process direct social links
-                            for platform_lower, link in page_direct_social.items():
-                                platform = platform_lower.capitalize()
-                                if platform in social_data and link and not social_data.get(platform):
-                                    if RobustSocialExtractor._is_valid_social_url(link, platform):
-                                        social_data[platform] = link
+                                if (!currentDay) continue;
                             
-                            # Add text-extracted social links
-                            for platform, link in page_social.items():
-                                if link and not social_data.get(platform):
-                                    social_data[platform] = link
+                                // Extract hours using various patterns
+                                let hours = '';
                             
-                            # Extract any additional emails
-                            page_emails = RobustSocialExtractor.extract_emails_from_text(page_text)
-                            emails.extend(page_emails)
+                                // Pattern 1: Standard hours format (9:00 AM - 5:00 PM)
+                                const standardHoursMatch = rowText.match(new RegExp(`${currentDay}\\s*(.+)`));
+                                if (standardHoursMatch) {
+                                    hours = standardHoursMatch[1].trim();
+                                }
                             
-                            # Also check for mailto links
-                            page_mailto = await page.evaluate('''
-                                () => {
-                                    const links = document.querySelectorAll('a[href^="mailto:"]');
-                                    return Array.from(links).map(link => link.href.replace('mailto:', '')).filter(email => email.includes('@'));
+                                // Handle special cases like "Closed" or "Open 24 hours"
+                                if (rowText.includes('Closed')) {
+                                    hours = 'Closed';
+                                } else if (rowText.includes('Open 24 hours')) {
+                                    hours = 'Open 24 hours';
+                                } else if (rowText.includes('24 hours')) {
+                                    hours = 'Open 24 hours';
                                 }
-                            ''')
                             
-                            for email in page_mailto:
-                                if RobustSocialExtractor._is_valid_email(email.lower()):
-                                    emails.append(email.lower())
-                        
-                        except Exception as e:
-                            # Just continue to the next page if there's an error
-                            continue
-                    
-                    # Check footer links directly on the main page
-                    try:
-                        # Go back to the main page
-                        await page.goto(url, timeout=20000, wait_until='domcontentloaded')
+                                // Extract opening/closing times if this is today
+                                if (rowText.includes(today)) {
+                                    targetRow = row;
+                                    const hoursMatch = rowText.match(/(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/);
+                                    if (hoursMatch) {
+                                        openingTime = hoursMatch[1].trim();
+                                        closingTime = hoursMatch[2].trim();
+                                    } else if (hours === 'Open 24 hours') {
+                                        openingTime = '12:00 AM';
+                                        closingTime = '11:59 PM';
+                                    }
+                                }
+                            
+                                // Store in formatted schedule
+                                formattedSchedule[currentDay] = hours;
+                            
+                                // Also add to full schedule array for backward compatibility
+                                fullSchedule.push(`${currentDay}: ${hours}`);
+                            }
                         
-                        # Look specifically at footer links
-                        footer_social = await page.evaluate('''
-                            () => {
-                                const results = {};
-                                const socialDomains = {
-                                    'facebook': ['facebook.com', 'fb.com', 'fb.me'],
-                                    'instagram': ['instagram.com', 'instagr.am'],
-                                    'twitter': ['twitter.com', 'x.com', 't.co'],
-                                    'linkedin': ['linkedin.com'],
-                                    'youtube': ['youtube.com', 'youtu.be'],
-                                    'tiktok': ['tiktok.com', 'vm.tiktok.com'],
-                                    'yelp': ['yelp.com'],
-                                    'whatsapp': ['wa.me', 'whatsapp.com'],
-                                    'pinterest': ['pinterest.com', 'pin.it']
-                                };
-                                
-                                // Look for footer elements
-                                const footers = document.querySelectorAll('footer, .footer, [class*="footer"], [id*="footer"]');
-                                
-                                footers.forEach(footer => {
-                                    const links = footer.querySelectorAll('a[href]');
-                                    links.forEach(link => {
-                                        try {
-                                            const href = link.href;
-                                            if (!href || href.startsWith('javascript:')) return;
-                                            
-                                            const url = new URL(href);
-                                            const hostname = url.hostname.toLowerCase();
-                                            
-                                            for (const [platform, domains] of Object.entries(socialDomains)) {
-                                                if (domains.some(domain => hostname.includes(domain))) {
-                                                    results[platform] = url.href;
-                                                }
-                                            }
-                                        } catch (e) {
-                                            // Skip invalid URLs
-                                        }
-                                    });
-                                });
-                                
-                                return results;
+                            // If we didn't find today, use the first day as default
+                            if (!targetRow && Object.keys(formattedSchedule).length > 0) {
+                                const firstDay = Object.keys(formattedSchedule)[0];
+                                const firstDayHours = formattedSchedule[firstDay];
+                            
+                                if (firstDayHours !== 'Closed' && firstDayHours !== 'Open 24 hours') {
+                                    const hoursMatch = firstDayHours.match(/(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/);
+                                    if (hoursMatch) {
+                                        openingTime = hoursMatch[1].trim();
+                                        closingTime = hoursMatch[2].trim();
+                                    }
+                                } else if (firstDayHours === 'Open 24 hours') {
+                                    openingTime = '12:00 AM';
+                                    closingTime = '11:59 PM';
+                                }
                             }
-                        ''')
                         
-                        # Process footer social links
-                        for platform_lower, link in footer_social.items():
-                            platform = platform_lower.capitalize()
-                            if platform in social_data and link and not social_data.get(platform):
-                                if RobustSocialExtractor._is_valid_social_url(link, platform):
-                                    social_data[platform] = link
-                                    
-                    except Exception as e:
-                        pass  # Silent error
-                
-                # Remove duplicates from emails
-                emails = list(set(emails))
-                
-                final_social_count = sum(1 for v in social_data.values() if v)
-                print(f"Found: {final_social_count} social links, {len(emails)} emails")
-                
-                # Store in cache if we have a valid domain
-                if domain:
-                    WEBSITE_EXTRACTION_CACHE[domain] = (social_data, emails)
-                    
-                # Close the website browser
-                await website_browser.close()
-                    
-                return social_data, emails
-                
-            except Exception as e:
-                print(f"Error during extraction from {url}: {e}")
-                try:
-                    await website_browser.close()
-                except:
-                    pass
-                return social_data, emails
-                
-    except Exception as e:
-        print(f"Error creating page for {url}: {e}")
-        return {}, []
+                            // Format the weekly schedule in a consistent way
+                            const formattedWeeklySchedule = daysOfWeek
+                                .map(day => `${day}: ${formattedSchedule[day] || 'Hours not available'}`)
+                                .join('; ');
+                        
+                            return {
+                                opening: openingTime,
+                                closing: closingTime,
+                                workingHours: formattedWeeklySchedule || fullSchedule.join('; ')
+                            };
+                        } catch (e) {
+                            console.error('Error extracting hours:', e);
+                            return { opening: '', closing: '', workingHours: '' };
+                        }
+                    }
+                ''')
+            
+                opening_time = expanded_hours.get('opening', '')
+                closing_time = expanded_hours.get('closing', '')
+                business_hours = expanded_hours.get('workingHours', '')
+        except Exception as e:
+            logger.warning("Error extracting expanded hours: %s", e)
+    else:
+        # Use the hours data we already got
+        opening_time = hours_data.get('opening', '')
+        closing_time = hours_data.get('closing', '')
+        business_hours = hours_data.get('workingHours', '')
+    
+    if not phone:
+        phone_matches = PHONE_PATTERN.findall(all_text)
+        phone = phone_matches[0] if phone_matches else ''
+    
+    # Enhanced website extraction
+    website = ''
+    for href in panel.get('websites') or []:
+        if href and 'google.com' not in href:
+            website = href
+            break
+    
+    if not website:
+        domain_match = WEBSITE_DOMAIN_PATTERN.search(all_text)
+        if domain_match:
+            website = domain_match.group(0)
+    
+    # Enhanced email extraction
+    email = ''
+    if panel.get('mailto'):
+        email = panel['mailto'].replace('mailto:', '').strip()
+    
+    if not email:
+        emails = await asyncio.to_thread(RobustSocialExtractor.extract_emails_from_text, all_text)
+        email = emails[0] if emails else ''
+    
+    return {
+        'Business Name': name,
+        'Business Type': business_type,
+        'Address': address,
+        'Phone Number': phone,
+        'Email': email,
+        'Website': website,
+        'Opening Time': opening_time,
+        'Closing Time': closing_time,
+        'Business Hours': business_hours,
+    }
 
 async def scrape_google_maps(query, max_cards=200, controller=controller):
     data = []
-    unique_hashes = set()
+    unique_hashes: Set[tuple] = set()
+    # Lowercased name -> lowercased addresses of the businesses kept under that name
+    known_addresses: Dict[str, List[str]] = {}
     
     # Track processed domains to avoid redundancy
     processed_website_domains = set()
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)  # Show the Google Maps browser window
-        context = await browser.new_context()
-        page = await context.new_page()
+    # Bounds concurrent Gemini requests for this run, cards are sent in batches
+    gemini_semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+    gemini_batcher = GeminiBatcher(gemini_semaphore)
+    
+    # Early stop signals for the card workers
+    controller.start_run()
+    target_reached = asyncio.Event()
+    if max_cards <= 0:
+        target_reached.set()
+    
+    print(f'Streaming extracted businesses to {CSV_OUTPUT_FILE}')
+    csv_writer = BusinessCsvWriter(CSV_OUTPUT_FILE)
+    
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=False)  # Show the Google Maps browser window
+            context = await browser.new_context()
+            # Stylesheets stay enabled, the panel selectors and innerText depend on layout
+            await context.route('**/*', block_heavy_resources)
+            page = await context.new_page()
         
-        print('Opening Google Maps...')
-        await page.goto(SEARCH_URL)
-        await page.wait_for_selector('input#searchboxinput', timeout=15000)
-        await page.fill('input#searchboxinput', query)
-        await page.click('button#searchbox-searchbutton')
-        await page.wait_for_selector('div[role="main"]', timeout=15000)
-        print('Waiting for results to load...')
-        await asyncio.sleep(2)
-
-        results_selector = '.Nv2PK, div[role="article"], .hfpxzc'
-        scrollable_selector = 'div[role="main"] div[aria-label][tabindex="0"]'
+            print('Opening Google Maps...')
+            await page.goto(SEARCH_URL)
+            await page.wait_for_selector('input#searchboxinput', timeout=15000)
+            await page.fill('input#searchboxinput', query)
+            await page.click('button#searchbox-searchbutton')
+            await page.wait_for_selector('div[role="main"]', timeout=15000)
+            print('Waiting for results to load...')
+            results_selector = '.Nv2PK, div[role="article"], .hfpxzc'
+            await wait_for_more_results(page, results_selector, 0, timeout=10000)
+
+            scrollable_selector = 'div[role="main"] div[aria-label][tabindex="0"]'
         
-        try:
-            scrollable = await page.query_selector(scrollable_selector)
-        except Exception:
-            scrollable = None
-        if not scrollable:
-            scrollable = page
-
-        # Initialize tracking variables
-        processed_titles = set()
-        processed_cards = set()
-        no_new_cards_scrolls = 0
-        max_no_new_cards_scrolls = 12  # Reduced from 25 to make process faster
-        consecutive_same_count = 0
-        max_consecutive_same_count = 5  # Reduced from 8 to make process faster
+            # Install the scroll helpers now and on any future navigation of this page
+            await page.add_init_script(script=MAPS_SCROLL_HELPERS_JS)
+            await page.evaluate(MAPS_SCROLL_HELPERS_JS)
         
-        print(f'Starting incremental extraction (target: {max_cards} unique businesses)...')
+            try:
+                scrollable = await page.query_selector(scrollable_selector)
+            except Exception:
+                scrollable = None
+            if not scrollable:
+                scrollable = page
+
+            # Initialize tracking variables
+            processed_titles = set()
+            processed_cards = set()
+            processed_hrefs = set()
+            no_new_cards_scrolls = 0
+            max_no_new_cards_scrolls = 12  # Reduced from 25 to make process faster
+            consecutive_same_count = 0
+            max_consecutive_same_count = 5  # Reduced from 8 to make process faster
+
+            # Business details are opened on worker pages so several cards are extracted at once
+            data_lock = asyncio.Lock()
+            results_page_lock = asyncio.Lock()
+            worker_pages = [await context.new_page() for _ in range(CARD_WORKER_PAGES)]
+            # Cards whose page has moved on while they wait for Gemini, bounded so workers can't run far ahead
+            card_slots = asyncio.Semaphore(2 * CARD_WORKER_PAGES)
+            card_tasks = set()
         
-        # Incremental extraction loop
-        while len(data) < max_cards:
-            if controller.stop_all_requested:
-                print('All stopped by user during extraction.')
-                break
-                
-            # Get currently visible cards
-            visible_cards = await page.query_selector_all(results_selector)
-            current_count = len(visible_cards)
+            # Website crawls run as a separate stage, overlapping the extraction of later batches
+            website_semaphore = asyncio.Semaphore(WEBSITE_CRAWL_CONCURRENCY)
             
-            if current_count == 0:
-                print("No cards found. Waiting for cards to appear...")
-                await asyncio.sleep(2)
-                continue
-                
-            print(f'Found {current_count} visible cards. Extracting new ones...')
+            # One headless browser for all website crawls, its pages are reused from website_pages
+            website_browser = await p.chromium.launch(headless=True)
+            # The User-Agent is set once for the context, every pooled page inherits it
+            website_context = await website_browser.new_context(user_agent=USER_AGENT)
+            # Block images, media, fonts and trackers to speed up page loading
+            await website_context.route('**/*', block_heavy_resources)
+            website_pages = await PagePool.create(website_context, WEBSITE_CRAWL_CONCURRENCY)
+            website_records = []
+            website_tasks = []
+        
+            async def crawl_website_batch(records):
+                """Enrich a batch from the business websites, then stream the finished rows to the CSV file."""
+                try:
+                    await fetch_all_websites(records, website_pages, website_semaphore)
+                finally:
+                    # A cancelled batch still streams its rows with whatever was filled in
+                    for record in records:
+                        csv_writer.write(record)
+        
+            async def extract_card(card_page, title_text):
+                """Read one business from card_page, then finish it in the background so the page can open the next card."""
+                # Get all visible text for extraction (innerText skips hidden content in one layout pass)
+                try:
+                    all_text = await card_page.evaluate("() => document.body.innerText.replace(/\\s+/g, ' ').trim()")
+                except Exception as e:
+                    logger.warning('Error reading card %s: %s', title_text, e)
+                    return
             
-            # Extract data from visible cards that haven't been processed yet
-            new_cards_processed = 0
+                # The panel DOM is regular enough for most cards, Gemini is only asked when it misses the name or address
+                try:
+                    panel_fields = await extract_panel_fields(card_page, all_text)
+                except Exception as e:
+                    panel_fields = e
+                gemini_task = None
+                if isinstance(panel_fields, Exception) or not (panel_fields['Business Name'] and panel_fields['Address']):
+                    gemini_task = asyncio.ensure_future(gemini_batcher.extract(all_text))
+                
+                # Everything from here on works on the captured text, so the page is free for the next card
+                try:
+                    await card_slots.acquire()
+                except BaseException:
+                    if gemini_task:
+                        gemini_task.cancel()
+                    raise
+                task = asyncio.create_task(finish_card(title_text, all_text, gemini_task, panel_fields))
+                card_tasks.add(task)
+                task.add_done_callback(card_tasks.discard)
             
-            for idx, card in enumerate(visible_cards):
-                # Generate a unique card identifier based on position and text
+            async def finish_card(title_text, all_text, gemini_task, panel_fields):
+                """Complete a card in the background and free its slot."""
                 try:
-                    card_id = await card.evaluate('el => el.outerHTML.length')  # Use HTML length as part of fingerprint
-                    title_text = await card.evaluate('el => { const title = el.querySelector("div.fontHeadlineSmall"); return title ? title.textContent : ""; }')
-                    card_fingerprint = f"{idx}_{card_id}_{title_text}"
+                    await complete_card(title_text, all_text, gemini_task, panel_fields)
+                except Exception:
+                    # Page and Gemini failures are handled where they happen, anything else is a bug
+                    logger.exception('Error processing card %s', title_text)
+                finally:
+                    if gemini_task:
+                        gemini_task.cancel()  # No-op unless the card was cancelled while waiting
+                    card_slots.release()
+            
+            async def complete_card(title_text, all_text, gemini_task, panel_fields):
+                """Clean, deduplicate and record one business once its Gemini fields (if any) are in."""
+                gemini_data = None
+                if gemini_task:
+                    try:
+                        gemini_data = await gemini_task
+                    except Exception:
+                        gemini_data = None
+                if isinstance(panel_fields, Exception):
+                    if not gemini_data:
+                        logger.warning('Error reading card %s: %s', title_text, panel_fields)
+                        return
+                    fields = gemini_data
+                else:
+                    # Gemini only fills in what the panel left empty
+                    fields = dict(panel_fields)
+                    for key, value in (gemini_data or {}).items():
+                        if value and not fields.get(key):
+                            fields[key] = value
+            
+                name = fields.get('Business Name', '')
+                business_type = fields.get('Business Type', '')
+                address = fields.get('Address', '')
+                phone = fields.get('Phone Number', '')
+                email = fields.get('Email', '')
+                website = fields.get('Website', '')
+                opening_time = fields.get('Opening Time', '')
+                closing_time = fields.get('Closing Time', '')
+                business_hours = fields.get('Business Hours', '')
+
+                # Clean all fields
+                name = clean_field(name)
+                business_type = clean_field(business_type)
+                address = clean_field(address)
+                phone = clean_field(phone)
+                email = clean_field(email)
+                website = clean_field(website)
+                opening_time = clean_field(opening_time)
+                closing_time = clean_field(closing_time)
+                business_hours = clean_field(business_hours)
+            
+                # Standardize business hours format
+                business_hours = standardize_business_hours(business_hours)
+            
+                # Skip if no business name (invalid business)
+                if not name.strip():
+                    logger.debug('Skipping business with no name')
+                    return
+                
+                # Check and reserve under the lock so two workers never keep the same business
+                async with data_lock:
+                    # Check early if we have a duplicate name/address (improves performance)
+                    name_key = name.lower()
+                    address_key = address.lower()
+                    street_key = address_key.split(',')[0]
+                    for existing_address in known_addresses.get(name_key, ()):
+                        if (not address_key or not existing_address or address_key == existing_address or
+                                street_key == existing_address.split(',')[0]):
+                            logger.debug('Duplicate by name/address: %s', name)
+                            return
                     
-                    # Skip if we've already processed this card
-                    if card_fingerprint in processed_cards:
-                        continue
-                        
-                    # Mark as processed
-                    processed_cards.add(card_fingerprint)
+                    # Mark this title as processed
+                    if title_text:
+                        processed_titles.add(title_text.lower())
                     
-                    # Skip if title matches something we've already processed
-                    if title_text.lower() in processed_titles:
-                        print(f'Skipping duplicate title: {title_text}')
-                        continue
-                        
-                    # Process this card
-                    print(f'Processing new card: {title_text}')
-                    new_cards_processed += 1
+                    # Generate business hash for duplicate detection
+                    business_hash = create_business_hash(name, address, phone)
+                
+                    # Skip if it's a duplicate (hash already exists)
+                    if business_hash in unique_hashes:
+                        logger.debug('Duplicate: %s', name)
+                        return
+                
+                    # Add unique hash to set
+                    unique_hashes.add(business_hash)
+                    known_addresses.setdefault(name_key, []).append(address_key)
+            
+                # Normalize website URL
+                if website and not website.startswith('http'):
+                    website = normalize_url(website)
+            
+                # Get website domain for cache lookup
+                website_domain = None
+                if website:
+                    try:
+                        website_domain = website_cache_key(website)
+                    except Exception as e:
+                        logger.warning("Error parsing website URL: %s", e)
+                        website_domain = None
+            
+                # Initialize social media data
+                social_media_data = {platform: '' for platform in RobustSocialExtractor.SOCIAL_PATTERNS.keys()}
+                found_emails = [email] if email else []
+            
+                # Enhanced social media extraction from Google Maps page
+                maps_social_data = await asyncio.to_thread(RobustSocialExtractor.extract_social_from_text, all_text)
+                for platform, link in maps_social_data.items():
+                    if link:
+                        social_media_data[platform] = link
+            
+                # Website extraction reuses the cache, otherwise the crawl is deferred to the website stage
+                needs_crawl = False
+                if website and is_valid_url(website):
+                    cached_result = get_cached_website(website_domain) if website_domain else None
+                    if cached_result is not None:
+                        logger.debug('Using cached extraction for domain: %s', website_domain)
+                        cached_social, cached_emails = cached_result
                     
-                    # Extraction logic - similar to the existing logic
+                        # Merge with cached social data (cached takes precedence for non-empty values)
+                        for platform, link in cached_social.items():
+                            if link and not social_media_data.get(platform):
+                                social_media_data[platform] = link
+                    
+                        # Add cached emails
+                        found_emails.extend(cached_emails)
+                    elif email and sum(1 for link in social_media_data.values() if link) >= WEBSITE_SKIP_MIN_SOCIALS:
+                        # The crawl would only look for what Google Maps already gave us
+                        logger.debug('Skipping website crawl, Google Maps already has email and social links: %s', name)
+                    else:
+                        needs_crawl = True
+                        # Mark domain as processed to avoid future redundant processing
+                        if website_domain:
+                            processed_website_domains.add(website_domain)
+            
+                # Use the best email found
+                final_email = found_emails[0] if found_emails else ''
+            
+                # Create business data entry
+                business_data = {
+                    'Business Name': name,
+                    'Business Type': business_type,
+                    'Address': address,
+                    'Phone Number': phone,
+                    'Email': final_email,
+                    'Website': website,
+                    'Opening Time': opening_time,
+                    'Closing Time': closing_time,
+                    'Business Hours': business_hours,
+                    **social_media_data,
+                }
+            
+                # Add to data unless another worker already filled the target
+                async with data_lock:
+                    if target_reached.is_set():
+                        return
+                    data.append(business_data)
+                    if needs_crawl:
+                        website_records.append(business_data)
+                    else:
+                        csv_writer.write(business_data)
+                    if len(data) >= max_cards:
+                        target_reached.set()
+            
+                # Count social media platforms found
+                social_count = sum(1 for link in social_media_data.values() if link)
+                logger.info('UNIQUE #%s/%s | %s | Email: %s | Social: %s/9', len(data), max_cards, name, bool(final_email), social_count)
+            
+                if target_reached.is_set():
+                    logger.info('Reached target of %s unique businesses!', max_cards)
+        
+            async def open_and_extract(card_page, card, title_text, href):
+                """Open a card on its worker page, or click it on the results page when it has no link."""
+                if href:
                     try:
-                        await card.click()
-                        await page.wait_for_selector('h1, .fontHeadlineLarge, .DUwDvf', timeout=8000)
-                        await asyncio.sleep(1)  # Reduced from 1.5 to 1 for speed
-                        
-                        # Get all text content for extraction
-                        all_text = await page.evaluate('''
-                            () => {
-                                const getText = (el) => {
-                                    if (!el) return '';
-                                    return Array.from(el.childNodes)
-                                        .map(node => {
-                                            if (node.nodeType === 3) return node.textContent;
-                                            if (node.nodeType === 1) {
-                                                const style = window.getComputedStyle(node);
-                                                if (style.display === 'none' || style.visibility === 'hidden') return '';
-                                                return getText(node);
-                                            }
-                                            return '';
-                                        })
-                                        .join(' ')
-                                        .replace(/\\s+/g, ' ')
-                                        .trim();
-                                };
-                                return getText(document.body);
-                            }
-                        ''')
-                        
-                        # Try Gemini extraction first
-                        gemini_data = await extract_with_gemini(all_text)
-                        
-                        if gemini_data:
-                            name = gemini_data.get('Business Name', '')
-                            business_type = gemini_data.get('Business Type', '')
-                            address = gemini_data.get('Address', '')
-                            phone = gemini_data.get('Phone Number', '')
-                            email = gemini_data.get('Email', '')
-                            website = gemini_data.get('Website', '')
-                            opening_time = gemini_data.get('Opening Time', '')
-                            closing_time = gemini_data.get('Closing Time', '')
-                            business_hours = gemini_data.get('Business Hours', '')
-                        else:
-                            # Use manual extraction as fallback
-                            # ... [rest of the extraction code remains unchanged]
-                            name = await safe_text(page, 'h1, .fontHeadlineLarge, .DUwDvf, [data-item-id="title"]')
-                            business_type = await safe_text(page, '.fontBodyMedium button[jsaction*="pane.rating.category"], .skqShb')
-                            address = await safe_text(page, '[data-item-id="address"], .rogA2c, .Io6YTe.fontBodyMedium, .LrzXr')
-                            phone = await safe_text(page, '[data-item-id="phone"], .Io6YTe.fontBodyMedium, .UsdlK')
-                            
-                            # Extract opening and closing times
-                            opening_time = ''
-                            closing_time = ''
-                            business_hours = ''
-                            
-                            # Try to extract the hours information
-                            hours_data = await page.evaluate('''
-                                () => {
-                                    try {
-                                        // Find the hours container with more comprehensive selectors
-                                        const hoursContainer = document.querySelector('[data-item-id="oh"], .y0skZc, .t39EBf, [aria-label*="hour"], [aria-label*="open"], .IDyq0e, [data-ved][jsaction][role="button"][data-url*="hour"], .OMl5r');
-                                        
-                                        if (hoursContainer) {
-                                            // First check if today's hours are shown
-                                            const todayHours = document.querySelector('.fontBodyMedium[aria-label*="open"], .fontBodyMedium[aria-label*="close"], .ZDu9vd, .y0skZc, .OMl5r');
-                                            
-                                            let openingTime = '';
-                                            let closingTime = '';
-                                            let workingHours = '';
-                                            
-                                            if (todayHours) {
-                                                const hoursText = todayHours.textContent.trim();
-                                                workingHours = hoursText;
-                                                
-                                                // Extract hours using regex
-                                                const hoursMatch = hoursText.match(/(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/);
-                                                
-                                                if (hoursMatch) {
-                                                    openingTime = hoursMatch[1].trim();
-                                                    closingTime = hoursMatch[2].trim();
-                                                } else {
-                                                    // Try another regex pattern for "Opens at X"
-                                                    const opensMatch = hoursText.match(/Opens\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/i);
-                                                    if (opensMatch) {
-                                                        openingTime = opensMatch[1].trim();
-                                                    }
-                                                    
-                                                    // Try another pattern for "Closes at X"
-                                                    const closesMatch = hoursText.match(/Closes\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/i);
-                                                    if (closesMatch) {
-                                                        closingTime = closesMatch[1].trim();
-                                                    }
-                                                }
-                                                
-                                                // Check for special cases
-                                                if (hoursText.includes('24 hours') || hoursText.includes('Open 24 hours')) {
-                                                    openingTime = '12:00 AM';
-                                                    closingTime = '11:59 PM';
-                                                    workingHours = 'Open 24 hours';
-                                                } else if (hoursText.includes('Closed')) {
-                                                    workingHours = 'Closed';
-                                                }
-                                            }
-                                            
-                                            // Always return shouldClick: true to get the full weekly schedule
-                                            return {
-                                                opening: openingTime,
-                                                closing: closingTime,
-                                                workingHours: workingHours,
-                                                shouldClick: true // Always click to get full schedule
-                                            };
-                                        }
-                                        
-                                        // If no hours container found, still try to click for hours
-                                        return { opening: '', closing: '', workingHours: '', shouldClick: true };
-                                    } catch (e) {
-                                        console.error('Error in initial hours detection:', e);
-                                        return { opening: '', closing: '', workingHours: '', shouldClick: true };
-                                    }
-                                }
-                            ''')
-                            
-                            # Initialize business hours
-                            business_hours = ''
-                            
-                            # If we need to click the hours button to get more information
-                            if hours_data.get('shouldClick', False):
-                                try:
-                                    # Click on hours button if it exists
-                                    hours_button = await page.query_selector('[data-item-id="oh"], .y0skZc, .t39EBf, [aria-label*="hour"], [aria-label*="open"], .IDyq0e, [data-ved][jsaction][role="button"][data-url*="hour"]')
-                                    if hours_button:
-                                        await hours_button.click()
-                                        await asyncio.sleep(0.8)  # Reduced from 1 to 0.8 for speed
-                                        
-                                        # Extract hours from the expanded view
-                                        expanded_hours = await page.evaluate('''
-                                            () => {
-                                                try {
-                                                    // Find the hours container with more comprehensive selectors
-                                                    const daysContainer = document.querySelector('.dRgULb, [aria-label*="hour"] div[jsaction*="pane.openhours"], div[role="region"][aria-label*="hour"], .t39EBf, .MmmeYe');
-                                                    if (!daysContainer) return { opening: '', closing: '', workingHours: '' };
-                                                    
-                                                    // Get today's date info for finding current day
-                                                    const today = new Date().toLocaleDateString('en-US', { weekday: 'long' });
-                                                    
-                                                    // More comprehensive selector for day rows
-                                                    const dayRows = Array.from(daysContainer.querySelectorAll('tr, [role="row"], .mWUmld, .y0skZc div, div[jsaction*="pane.openhours"] div, .t39EBf div, .MmmeYe div'));
-                                                    
-                                                    // Days of the week for standardizing output
-                                                    const daysOfWeek = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'];
-                                                    
-                                                    // Build full working hours schedule with better formatting
-                                                    const fullSchedule = [];
-                                                    const formattedSchedule = {};
-                                                    let openingTime = '';
-                                                    let closingTime = '';
-                                                    let targetRow = null;
-                                                    
-                                                    // Process each day row
-                                                    for (const row of dayRows) {
-                                                        const rowText = row.textContent.trim();
-                                                        
-                                                        // Skip rows without day information
-                                                        if (!daysOfWeek.some(day => rowText.includes(day))) {
-                                                            continue;
-                                                        }
-                                                        
-                                                        // Determine which day this row represents
-                                                        let currentDay = '';
-                                                        for (const day of daysOfWeek) {
-                                                            if (rowText.includes(day)) {
-                                                                currentDay = day;
-                                                                break;
-                                                            }
-                                                        }
-                                                        
-                                                        if (!currentDay) continue;
-                                                        
-                                                        // Extract hours using various patterns
-                                                        let hours = '';
-                                                        
-                                                        // Pattern 1: Standard hours format (9:00 AM - 5:00 PM)
-                                                        const standardHoursMatch = rowText.match(new RegExp(`${currentDay}\\s*(.+)`));
-                                                        if (standardHoursMatch) {
-                                                            hours = standardHoursMatch[1].trim();
-                                                        }
-                                                        
-                                                        // Handle special cases like "Closed" or "Open 24 hours"
-                                                        if (rowText.includes('Closed')) {
-                                                            hours = 'Closed';
-                                                        } else if (rowText.includes('Open 24 hours')) {
-                                                            hours = 'Open 24 hours';
-                                                        } else if (rowText.includes('24 hours')) {
-                                                            hours = 'Open 24 hours';
-                                                        }
-                                                        
-                                                        // Extract opening/closing times if this is today
-                                                        if (rowText.includes(today)) {
-                                                            targetRow = row;
-                                                            const hoursMatch = rowText.match(/(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/);
-                                                            if (hoursMatch) {
-                                                                openingTime = hoursMatch[1].trim();
-                                                                closingTime = hoursMatch[2].trim();
-                                                            } else if (hours === 'Open 24 hours') {
-                                                                openingTime = '12:00 AM';
-                                                                closingTime = '11:59 PM';
-                                                            }
-                                                        }
-                                                        
-                                                        // Store in formatted schedule
-                                                        formattedSchedule[currentDay] = hours;
-                                                        
-                                                        // Also add to full schedule array for backward compatibility
-                                                        fullSchedule.push(`${currentDay}: ${hours}`);
-                                                    }
-                                                    
-                                                    // If we didn't find today, use the first day as default
-                                                    if (!targetRow && Object.keys(formattedSchedule).length > 0) {
-                                                        const firstDay = Object.keys(formattedSchedule)[0];
-                                                        const firstDayHours = formattedSchedule[firstDay];
-                                                        
-                                                        if (firstDayHours !== 'Closed' && firstDayHours !== 'Open 24 hours') {
-                                                            const hoursMatch = firstDayHours.match(/(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm))/);
-                                                            if (hoursMatch) {
-                                                                openingTime = hoursMatch[1].trim();
-                                                                closingTime = hoursMatch[2].trim();
-                                                            }
-                                                        } else if (firstDayHours === 'Open 24 hours') {
-                                                            openingTime = '12:00 AM';
-                                                            closingTime = '11:59 PM';
-                                                        }
-                                                    }
-                                                    
-                                                    // Format the weekly schedule in a consistent way
-                                                    const formattedWeeklySchedule = daysOfWeek
-                                                        .map(day => `${day}: ${formattedSchedule[day] || 'Hours not available'}`)
-                                                        .join('; ');
-                                                    
-                                                    return {
-                                                        opening: openingTime,
-                                                        closing: closingTime,
-                                                        workingHours: formattedWeeklySchedule || fullSchedule.join('; ')
-                                                    };
-                                                } catch (e) {
-                                                    console.error('Error extracting hours:', e);
-                                                    return { opening: '', closing: '', workingHours: '' };
-                                                }
-                                            }
-                                        ''')
-                                        
-                                        opening_time = expanded_hours.get('opening', '')
-                                        closing_time = expanded_hours.get('closing', '')
-                                        business_hours = expanded_hours.get('workingHours', '')
-                                except Exception as e:
-                                    print(f"Error extracting expanded hours: {e}")
-                            else:
-                                # Use the hours data we already got
-                                opening_time = hours_data.get('opening', '')
-                                closing_time = hours_data.get('closing', '')
-                                business_hours = hours_data.get('workingHours', '')
-                            
-                            if not phone:
-                                phone_matches = re.findall(r'(\+?\d[\d\s\-().]{8,}\d)', all_text)
-                                phone = phone_matches[0] if phone_matches else ''
-                            
-                            # Enhanced website extraction
-                            website = ''
-                            website_elements = await page.query_selector_all('a[data-item-id="authority"], a[aria-label*="Website"], .rogA2c a, .Io6YTe a')
-                            for element in website_elements:
-                                href = await element.get_attribute('href')
-                                if href and 'google.com' not in href:
-                                    website = href
-                                    break
-                            
-                            if not website:
-                                domain_match = re.search(r'([a-zA-Z0-9\-\.]+\.(com|net|org|biz|info|co|us|in|uk|ca|au|io|me|site|store|online|tech|ai|app))', all_text)
-                                if domain_match:
-                                    website = domain_match.group(0)
-                            
-                            # Enhanced email extraction
-                            email = ''
-                            email_link = await page.query_selector('a[href^="mailto:"]')
-                            if email_link:
-                                email = (await email_link.get_attribute('href')).replace('mailto:', '').strip()
-                            
-                            if not email:
-                                emails = RobustSocialExtractor.extract_emails_from_text(all_text)
-                                email = emails[0] if emails else ''
-
-                        # Clean all fields
-                        name = clean_field(name)
-                        business_type = clean_field(business_type)
-                        address = clean_field(address)
-                        phone = clean_field(phone)
-                        email = clean_field(email)
-                        website = clean_field(website)
-                        opening_time = clean_field(opening_time)
-                        closing_time = clean_field(closing_time)
-                        business_hours = clean_field(business_hours)
-                        
-                        # Standardize business hours format
-                        business_hours = standardize_business_hours(business_hours)
-                        
-                        # Skip if no business name (invalid business)
-                        if not name.strip():
-                            print(f'Skipping business with no name')
+                        await card_page.goto(href)
+                        await card_page.wait_for_selector('h1, .fontHeadlineLarge, .DUwDvf', timeout=8000)
+                    except Exception as e:
+                        logger.warning('Error opening card %s: %s', title_text, e)
+                        return
+                    await extract_card(card_page, title_text)
+                else:
+                    # The results page has a single details pane, so these clicks must not interleave
+                    async with results_page_lock:
+                        try:
+                            await card.click()
+                            await page.wait_for_selector('h1, .fontHeadlineLarge, .DUwDvf', timeout=8000)
+                        except Exception as e:
+                            logger.warning('Error opening card %s: %s', title_text, e)
+                            return
+                        await extract_card(page, title_text)
+        
+            async def card_worker(card_page, queue):
+                while not (target_reached.is_set() or controller.stop_event.is_set()):
+                    try:
+                        card, title_text, href = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    await open_and_extract(card_page, card, title_text, href)
+        
+            async def extract_batch(queue):
+                """Run the card workers over queue, then wait for the cards still finishing in the background."""
+                await asyncio.gather(*(card_worker(worker_page, queue) for worker_page in worker_pages))
+                while card_tasks:
+                    await asyncio.gather(*card_tasks, return_exceptions=True)
+        
+            print(f'Starting incremental extraction (target: {max_cards} unique businesses)...')
+        
+            # Incremental extraction loop
+            while not target_reached.is_set():
+                if controller.stop_event.is_set():
+                    print('All stopped by user during extraction.')
+                    break
+                
+                # Read the fingerprint, title and place link of every visible card in one DOM pass
+                card_infos = await page.evaluate('''
+                    (selector) => Array.from(document.querySelectorAll(selector)).map(el => {
+                        const title = el.querySelector("div.fontHeadlineSmall");
+                        const link = el.matches("a.hfpxzc") ? el : el.querySelector("a.hfpxzc");
+                        return {
+                            length: el.outerHTML.length,  // Use HTML length as part of fingerprint
+                            title: title ? title.textContent : "",
+                            href: link ? link.href : ""
+                        };
+                    })
+                ''', results_selector)
+                current_count = len(card_infos)
+            
+                if current_count == 0:
+                    print("No cards found. Waiting for cards to appear...")
+                    await wait_for_more_results(page, results_selector, 0)
+                    continue
+                
+                print(f'Found {current_count} visible cards. Extracting new ones...')
+            
+                # Queue the visible cards that haven't been processed yet
+                new_cards_processed = 0
+                card_queue = asyncio.Queue()
+                queued_titles = set()
+                card_handles = None  # Only needed for cards without a place link
+            
+                for idx, card_info in enumerate(card_infos):
+                    # Generate a unique card identifier based on position and text
+                    try:
+                        title_text = card_info['title']
+                        href = card_info['href']
+                        card_fingerprint = f"{idx}_{card_info['length']}_{title_text}"
+                    
+                        # Skip if we've already processed this card
+                        if card_fingerprint in processed_cards:
                             continue
-                            
-                        # Check early if we have a duplicate name/address (improves performance)
-                        name_address_match = False
-                        for existing in data:
-                            if name.lower() == existing['Business Name'].lower() and (
-                                not address or not existing['Address'] or 
-                                address.lower() == existing['Address'].lower() or
-                                (address and existing['Address'] and address.split(',')[0].lower() == existing['Address'].split(',')[0].lower())
-                            ):
-                                print(f'Duplicate by name/address: {name}')
-                                name_address_match = True
-                                break
                         
-                        if name_address_match:
+                        # Mark as processed
+                        processed_cards.add(card_fingerprint)
+                    
+                        # A result container and its link overlay point at the same place
+                        if href and href in processed_hrefs:
                             continue
-                            
-                        # Mark this title as processed
-                        if title_text:
-                            processed_titles.add(title_text.lower())
-                            
-                        # Generate business hash for duplicate detection
-                        business_hash = create_business_hash(name, address, phone)
-                        
-                        # Skip if it's a duplicate (hash already exists)
-                        if business_hash in unique_hashes:
-                            print(f'Duplicate: {name}')
+                    
+                        # Skip if title matches something we've already processed or queued
+                        if title_text.lower() in processed_titles or title_text.lower() in queued_titles:
+                            logger.debug('Skipping duplicate title: %s', title_text)
                             continue
+                        if title_text:
+                            queued_titles.add(title_text.lower())
                         
-                        # Normalize website URL
-                        if website and not website.startswith('http'):
-                            website = normalize_url(website)
-                        
-                        # Get website domain for cache lookup
-                        website_domain = None
-                        if website:
-                            try:
-                                parsed_url = urlparse(website)
-                                website_domain = parsed_url.netloc.lower()
-                            except Exception as e:
-                                print(f"Error parsing website URL: {e}")
-                                website_domain = None
-                        
-                        # Initialize social media data
-                        social_media_data = {platform: '' for platform in RobustSocialExtractor.SOCIAL_PATTERNS.keys()}
-                        found_emails = [email] if email else []
-                        
-                        # Enhanced social media extraction from Google Maps page
-                        maps_social_data = RobustSocialExtractor.extract_social_from_text(all_text)
-                        for platform, link in maps_social_data.items():
-                            if link:
-                                social_media_data[platform] = link
-                        
-                        # Enhanced website extraction with caching
-                        if website and is_valid_url(website):
-                            # Check if we've already processed this domain before
-                            if website_domain and website_domain in processed_website_domains:
-                                print(f'Using cached extraction for domain: {website_domain}')
-                                if website_domain in WEBSITE_EXTRACTION_CACHE:
-                                    cached_social, cached_emails = WEBSITE_EXTRACTION_CACHE[website_domain]
-                                    
-                                    # Merge with cached social data (cached takes precedence for non-empty values)
-                                    for platform, link in cached_social.items():
-                                        if link and not social_media_data.get(platform):
-                                            social_media_data[platform] = link
-                                    
-                                    # Add cached emails
-                                    found_emails.extend(cached_emails)
-                            else:
-                                print(f'Enhanced extraction from website: {website}')
-                                try:
-                                    website_social_data, website_emails = await enhanced_extract_from_website(website, context)
-                                    
-                                    # Mark domain as processed to avoid future redundant processing
-                                    if website_domain:
-                                        processed_website_domains.add(website_domain)
-                                    
-                                    # Merge social media data (website takes precedence)
-                                    for platform, link in website_social_data.items():
-                                        if link and not social_media_data.get(platform):
-                                            social_media_data[platform] = link
-                                    
-                                    # Add website emails
-                                    found_emails.extend(website_emails)
-                                except Exception as e:
-                                    print(f'Error in website extraction: {e}')
-                        
-                        # Use the best email found
-                        final_email = found_emails[0] if found_emails else ''
-                        
-                        # Create business data entry
-                        business_data = {
-                            'Business Name': name,
-                            'Business Type': business_type,
-                            'Address': address,
-                            'Phone Number': phone,
-                            'Email': final_email,
-                            'Website': website,
-                            'Opening Time': opening_time,
-                            'Closing Time': closing_time,
-                            'Business Hours': business_hours,
-                            'Facebook': social_media_data['Facebook'],
-                            'Instagram': social_media_data['Instagram'],
-                            'Twitter': social_media_data['Twitter'],
-                            'LinkedIn': social_media_data['LinkedIn'],
-                            'YouTube': social_media_data['YouTube'],
-                            'TikTok': social_media_data['TikTok'],
-                            'Yelp': social_media_data['Yelp'],
-                            'WhatsApp': social_media_data['WhatsApp'],
-                            'Pinterest': social_media_data['Pinterest'],
-                        }
-                        
-                        # Add unique hash to set
-                        unique_hashes.add(business_hash)
-                        
-                        # Add to data
-                        data.append(business_data)
-                        
-                        # Count social media platforms found
-                        social_count = sum(1 for platform, link in social_media_data.items() if link)
-                        print(f'UNIQUE #{len(data)}/{max_cards} | {name} | Email: {bool(final_email)} | Social: {social_count}/9')
+                        # Cards without a link are clicked on the results page
+                        card = None
+                        if href:
+                            processed_hrefs.add(href)
+                        else:
+                            if card_handles is None:
+                                card_handles = await page.query_selector_all(results_selector)
+                            if idx >= len(card_handles):
+                                continue
+                            card = card_handles[idx]
                         
-                        # Break the card processing loop if we've reached the target
-                        if len(data) >= max_cards:
-                            print(f'Reached target of {max_cards} unique businesses!')
-                            break
-                            
+                        # Process this card
+                        logger.debug('Processing new card: %s', title_text)
+                        new_cards_processed += 1
+                        card_queue.put_nowait((card, title_text, href))
                     except Exception as e:
-                        print(f'Error processing card: {e}')
+                        logger.warning('Error getting card info: %s', e)
                         continue
-                except Exception as e:
-                    print(f'Error getting card info: {e}')
-                    continue
             
-            # Check if we need to scroll more
-            if len(data) >= max_cards:
-                print(f'Target reached: {len(data)}/{max_cards} businesses')
-                break
+                # Extract the queued cards concurrently, one worker per page, until the
+                # queue is drained, the target is reached or the user stops everything
+                workers = asyncio.ensure_future(extract_batch(card_queue))
+                early_stops = [asyncio.create_task(target_reached.wait()), asyncio.create_task(controller.stop_event.wait())]
+                await asyncio.wait([workers, *early_stops], return_when=asyncio.FIRST_COMPLETED)
+                for task in early_stops:
+                    task.cancel()
+                if not workers.done():
+                    # Cancel the cards still in flight instead of waiting for them
+                    workers.cancel()
+                    for task in card_tasks:
+                        task.cancel()
+                    await asyncio.gather(workers, *card_tasks, return_exceptions=True)
+            
+                # Hand this batch's websites to the crawl stage
+                if website_records and not controller.stop_event.is_set():
+                    website_tasks.append(asyncio.create_task(crawl_website_batch(list(website_records))))
+                    website_records.clear()
+            
+                # Check if we need to scroll more
+                if target_reached.is_set():
+                    print(f'Target reached: {len(data)}/{max_cards} businesses')
+                    break
                 
-            if controller.stop_scrolling_requested:
-                print(f'Scrolling stopped by user. Extracted {len(data)} businesses so far.')
-                break
+                if controller.stop_scrolling_requested:
+                    print(f'Scrolling stopped by user. Extracted {len(data)} businesses so far.')
+                    break
                 
-            if new_cards_processed == 0:
-                no_new_cards_scrolls += 1
-                consecutive_same_count += 1
-                print(f'No new unique cards found in this batch. Scroll attempt {no_new_cards_scrolls}/{max_no_new_cards_scrolls}')
+                if new_cards_processed == 0:
+                    no_new_cards_scrolls += 1
+                    consecutive_same_count += 1
+                    print(f'No new unique cards found in this batch. Scroll attempt {no_new_cards_scrolls}/{max_no_new_cards_scrolls}')
                 
-                if consecutive_same_count >= max_consecutive_same_count:
-                    print(f'No new cards found after {consecutive_same_count} consecutive attempts. Trying aggressive scroll...')
-                    # Aggressive scroll to try to load more results
-                    try:
-                        for _ in range(5):
-                            await page.evaluate('''
-                                () => {
-                                    const mainContainer = document.querySelector('div[role="main"] div[aria-label][tabindex="0"]');
-                                    if (mainContainer) {
-                                        mainContainer.scrollBy(0, 3000);
-                                    }
-                                    window.scrollBy(0, 2000);
-                                }
-                            ''')
-                            await page.keyboard.press('End')
-                            await page.mouse.wheel(0, 3000)
-                            await asyncio.sleep(0.3)
-                        await asyncio.sleep(1.5)
-                    except Exception as e:
-                        print(f"Aggressive scroll failed: {e}")
+                    if consecutive_same_count >= max_consecutive_same_count:
+                        print(f'No new cards found after {consecutive_same_count} consecutive attempts. Trying aggressive scroll...')
+                        # Aggressive scroll to try to load more results
+                        try:
+                            for _ in range(5):
+                                await page.evaluate('window.__aggressiveScroll()')
+                                await page.keyboard.press('End')
+                                await page.mouse.wheel(0, 3000)
+                                await wait_for_more_results(page, results_selector, current_count, timeout=300)
+                            await wait_for_more_results(page, results_selector, current_count, timeout=1500)
+                        except Exception as e:
+                            print(f"Aggressive scroll failed: {e}")
                 
-                if no_new_cards_scrolls >= max_no_new_cards_scrolls:
-                    print(f'Maximum scroll attempts reached. Stopping with {len(data)} businesses.')
-                    break
-            else:
-                print(f'Found {new_cards_processed} new businesses in this batch')
-                no_new_cards_scrolls = 0
-                consecutive_same_count = 0
+                    if no_new_cards_scrolls >= max_no_new_cards_scrolls:
+                        print(f'Maximum scroll attempts reached. Stopping with {len(data)} businesses.')
+                        break
+                else:
+                    print(f'Found {new_cards_processed} new businesses in this batch')
+                    no_new_cards_scrolls = 0
+                    consecutive_same_count = 0
             
-            # Scroll to get more cards
-            try:
-                # Scroll down to load more results
-                await page.evaluate('''
-                    (selector) => {
-                        const scrollable = document.querySelector(selector);
-                        if (scrollable) {
-                            scrollable.scrollBy(0, 1500);
-                        } else {
-                            window.scrollBy(0, 1500);
-                        }
-                    }
-                ''', scrollable_selector)
-                
-                # Additional scrolling with key and mouse
-                await page.keyboard.press('PageDown')
-                await page.mouse.wheel(0, 1000)
+                # Scroll to get more cards
+                try:
+                    # Scroll the results panel to its end in one call to load more results
+                    await page.evaluate('window.__scrollResultsToEnd()')
                 
-                # Short wait for new cards to load
-                await asyncio.sleep(1)
+                    # Wait until new cards load, or give up quickly when there are none
+                    await wait_for_more_results(page, results_selector, current_count, timeout=1000)
                 
-            except Exception as e:
-                print(f'Error scrolling: {e}')
-                # Try alternative scrolling
-                try:
-                    await page.evaluate('window.scrollBy(0, 1500)')
-                    await asyncio.sleep(1)
-                except:
-                    pass
-
-        # Print statistics before closing
-        print(f"\nExtraction complete!")
-        print(f"Total unique businesses extracted: {len(data)}")
-        print(f"Total domains in extraction cache: {len(WEBSITE_EXTRACTION_CACHE)}")
-        print(f"Total processed website domains: {len(processed_website_domains)}")
+                except Exception as e:
+                    print(f'Error scrolling: {e}')
+                    # Try alternative scrolling
+                    try:
+                        await page.evaluate('window.scrollBy(0, 1500)')
+                        await wait_for_more_results(page, results_selector, current_count, timeout=1000)
+                    except:
+                        pass
+
+            # Wait for the website stage to finish enriching the collected businesses. After Stop All the
+            # remaining crawls are dropped and the businesses keep the fields Google Maps gave them
+            if website_records:
+                if controller.stop_event.is_set():
+                    for record in website_records:
+                        csv_writer.write(record)
+                else:
+                    website_tasks.append(asyncio.create_task(crawl_website_batch(list(website_records))))
+                website_records.clear()
+            if website_tasks:
+                print('Waiting for website extraction to finish...')
+                crawls = asyncio.gather(*website_tasks)
+                stop_requested = asyncio.ensure_future(controller.stop_event.wait())
+                await asyncio.wait({crawls, stop_requested}, return_when=asyncio.FIRST_COMPLETED)
+                stop_requested.cancel()
+                if crawls.done():
+                    crawls.result()
+                else:
+                    print('All stopped by user, skipping the remaining website extraction.')
+                    crawls.cancel()
+                    await asyncio.gather(crawls, *website_tasks, return_exceptions=True)
+        
+            # Print statistics before closing
+            print(f"\nExtraction complete!")
+            print(f"Total unique businesses extracted: {len(data)}")
+            print(f"Total domains in extraction cache: {len(WEBSITE_EXTRACTION_CACHE)}")
+            print(f"Total processed website domains: {len(processed_website_domains)}")
         
-        await browser.close()
+            # Crawls cancelled by Stop All must be done with their pages before the browser goes away
+            await cancel_website_crawls()
+            await website_browser.close()
+            await browser.close()
         
-        # Return exactly max_cards businesses or all we could find
-        return data[:max_cards]
+            # Return exactly max_cards businesses or all we could find
+            return data[:max_cards]
+    finally:
+        gemini_batcher.close()
+        csv_writer.close()
+        # No crawl may outlive the run and reopen the HTTP client after it is closed
+        await cancel_website_crawls()
+        # The pooled connections belong to this event loop, never reuse them across runs
+        await close_http_client()
+
+# Runs the blocking part of each UI run (waiting on the scrape, then the export), one run at a time
+SCRAPER_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scraper')
+
+# Background event loop the UI submits scrape runs to, started once and reused for every run
+_scraper_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_scraper_loop() -> asyncio.AbstractEventLoop:
+    """Return the background scraper event loop, starting its thread on first use"""
+    global _scraper_loop
+    if _scraper_loop is None:
+        _scraper_loop = asyncio.new_event_loop()
+        threading.Thread(target=_scraper_loop.run_forever, name='scraper-loop', daemon=True).start()
+    return _scraper_loop
 
 def run_scraper_from_ui(query, max_cards, status_label, button, stop_scroll_button, stop_all_button):
+    def post(callback, *args, **kwargs):
+        """Queue a Tk call onto the UI thread, widgets must not be touched from the worker thread"""
+        status_label.after(0, lambda: callback(*args, **kwargs))
+
     def task():
         controller.stop_scrolling_requested = False
         controller.stop_all_requested = False
         try:
             requested_cards = max_cards.get()
-            status_label.config(text=f'Enhanced scraping in progress for {requested_cards} businesses...')
-            results = asyncio.run(scrape_google_maps(query.get(), requested_cards, controller=controller))
-            export_to_excel(results, OUTPUT_FILE)
-            status_label.config(text='Enhanced extraction complete!')
+            post(status_label.config, text=f'Enhanced scraping in progress for {requested_cards} businesses...')
+            run = asyncio.run_coroutine_threadsafe(
+                scrape_google_maps(query.get(), requested_cards, controller=controller), get_scraper_loop()
+            )
+            results = run.result()
+            stats = export_to_excel(results, OUTPUT_FILE)
+            if stats is None:
+                raise RuntimeError(f'could not export results to {OUTPUT_FILE}')
+            post(status_label.config, text='Enhanced extraction complete!')
             
-            # Show detailed success message
-            social_count = sum(1 for business in results for platform in ['Facebook', 'Instagram', 'Twitter', 'LinkedIn', 'YouTube', 'TikTok', 'Yelp', 'WhatsApp', 'Pinterest'] if business.get(platform))
-            email_count = sum(1 for business in results if business.get('Email'))
-            website_count = sum(1 for business in results if business.get('Website'))
+            # Show detailed success message, counted by the export over the deduplicated rows
+            total = stats['total']
+            email_count, website_count, social_count = stats['emails'], stats['websites'], stats['social']
             
             # Check if we got exactly what the user requested
-            if len(results) < requested_cards:
+            if total < requested_cards:
                 message = f'''Enhanced Scraping Complete!
                 
-Could only extract {len(results)} unique businesses out of the {requested_cards} requested.
+Could only extract {total} unique businesses out of the {requested_cards} requested.
 (This may be due to limited search results or duplicates)
 
-• {email_count} businesses with emails ({email_count/len(results):.1%})
-• {website_count} businesses with websites ({website_count/len(results):.1%})  
+• {email_count} businesses with emails ({email_count/total:.1%})
+• {website_count} businesses with websites ({website_count/total:.1%})  
 • {social_count} total social media links found
                 
 Data exported to: {OUTPUT_FILE}'''
             else:
                 message = f'''Enhanced Scraping Complete!
                 
-Successfully extracted {len(results)} businesses - exactly as requested!
-• {email_count} businesses with emails ({email_count/len(results):.1%})
-• {website_count} businesses with websites ({website_count/len(results):.1%})  
+Successfully extracted {total} businesses - exactly as requested!
+• {email_count} businesses with emails ({email_count/total:.1%})
+• {website_count} businesses with websites ({website_count/total:.1%})  
 • {social_count} total social media links found
                 
 Data exported to: {OUTPUT_FILE}'''
             
-            messagebox.showinfo('Enhanced Extraction Complete', message)
+            post(messagebox.showinfo, 'Enhanced Extraction Complete', message)
             
         except Exception as e:
-            status_label.config(text='Error occurred')
-            messagebox.showerror('Error', f'Enhanced extraction failed: {str(e)}')
+            post(status_label.config, text='Error occurred')
+            post(messagebox.showerror, 'Error', f'Enhanced extraction failed: {str(e)}')
         finally:
-            button.config(state=tk.NORMAL)
-            stop_scroll_button.config(state=tk.DISABLED)
-            stop_all_button.config(state=tk.DISABLED)
+            post(button.config, state=tk.NORMAL)
+            post(stop_scroll_button.config, state=tk.DISABLED)
+            post(stop_all_button.config, state=tk.DISABLED)
     
-    threading.Thread(target=task).start()
+    SCRAPER_EXECUTOR.submit(task)
+
+FEATURES_TEXT = f'''✓ Advanced social media link extraction ({len(SOCIAL_PLATFORMS)} platforms)
+✓ Robust email detection with validation
+✓ Website crawling for additional data
+✓ Duplicate business detection
+✓ Enhanced data validation
+✓ Comprehensive Excel export with statistics
+✓ Extract EXACTLY the number of businesses you specify (up to {MAX_BUSINESSES})'''
 
 def launch_ui():
     """Enhanced UI with better styling and information"""
@@ -1963,15 +2767,7 @@ def launch_ui():
     features_frame = ttk.LabelFrame(main_frame, text='Enhanced Features', padding=15)
     features_frame.pack(fill=tk.X, pady=(0,15))
     
-    features_text = f'''✓ Advanced social media link extraction (9 platforms)
-✓ Robust email detection with validation
-✓ Website crawling for additional data
-✓ Duplicate business detection
-✓ Enhanced data validation
-✓ Comprehensive Excel export with statistics
-✓ Extract EXACTLY the number of businesses you specify (up to {MAX_BUSINESSES})'''
-    
-    features_label = ttk.Label(features_frame, text=features_text, font=('Arial', 9))
+    features_label = ttk.Label(features_frame, text=FEATURES_TEXT, font=('Arial', 9))
     features_label.pack(anchor=tk.W)
     
     # Control buttons section
@@ -2040,46 +2836,82 @@ def launch_ui():
     root.mainloop()
 
 # Add the export_to_excel function that was defined in auth.py but missing in app.py
+# Header style matching what pandas.to_excel writes
+HEADER_FONT = Font(bold=True)
+HEADER_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
+
+def sheet_columns(df, columns):
+    """Value lists of the given df columns for write_sheet, missing values and empty strings become None"""
+    values = {}
+    for column in columns:
+        series = df[column]
+        # openpyxl skips None instead of writing an empty cell element
+        blank = series.isna() | series.eq('')
+        if blank.any():
+            series = series.astype(object).where(~blank, None)
+        values[column] = series.tolist()
+    return values
+
+def write_sheet(workbook, title, columns, max_width):
+    """Append a dict of column name -> values as a new sheet of a write-only workbook, sizing columns from the data"""
+    worksheet = workbook.create_sheet(title)
+    
+    # Column widths must be set before the first row in write-only mode
+    for index, (column, values) in enumerate(columns.items(), start=1):
+        longest = max((len(str(value)) for value in values if value is not None), default=0)
+        worksheet.column_dimensions[get_column_letter(index)].width = min(max(len(column), longest) + 2, max_width)
+    
+    # Bold, bordered and centered header like pandas writes it
+    header = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet, value=column)
+        cell.font = HEADER_FONT
+        cell.border = HEADER_BORDER
+        cell.alignment = HEADER_ALIGNMENT
+        header.append(cell)
+    worksheet.append(header)
+    
+    # Stream rows straight from the column lists
+    for row in zip(*columns.values()):
+        worksheet.append(row)
+
 def export_to_excel(data, filename):
-    """Enhanced Excel export with better formatting and duplicate prevention"""
+    """Enhanced Excel export with better formatting and duplicate prevention, returns the exported row counts or None on failure"""
     try:
-        df = pd.DataFrame(data)
-        
-        # Reorder columns for better presentation
-        column_order = [
-            'Business Name', 'Business Type', 'Address', 'Phone Number', 
-            'Email', 'Website', 'Opening Time', 'Closing Time', 'Business Hours', 'Facebook', 'Instagram', 'Twitter', 
-            'LinkedIn', 'YouTube', 'TikTok', 'Yelp', 'WhatsApp', 'Pinterest'
-        ]
-        
-        # Only include columns that exist in the data
-        existing_columns = [col for col in column_order if col in df.columns]
-        df = df[existing_columns]
+        # Build the frame column by column in export order, only for columns that exist in the data,
+        # so pandas neither infers a schema from every record dict nor reindexes afterwards.
+        # Every field is text; the string dtype keeps missing values as NA and lets the .str methods run on string arrays
+        present_columns = {key for record in data for key in record}
+        df = pd.DataFrame(
+            {col: [record.get(col, '') for record in data] for col in COLUMN_ORDER if col in present_columns},
+            dtype='string',
+        )
         
         # Clean and normalize data to prevent duplicates
         for col in df.columns:
             if col in ['Business Name', 'Address', 'Phone Number', 'Email', 'Website']:
-                # Convert to string and clean
-                df[col] = df[col].astype(str).apply(lambda x: clean_field(x))
+                # Already text, missing values become empty strings before cleaning
+                df[col] = clean_series(df[col].fillna(''))
                 
                 # Normalize phone numbers
                 if col == 'Phone Number':
-                    df[col] = df[col].apply(lambda x: re.sub(r'[^\d+]', '', x))
+                    df[col] = df[col].str.replace(NON_PHONE_CHAR_PATTERN, '', regex=True)
                 
                 # Normalize emails
                 if col == 'Email':
-                    df[col] = df[col].apply(lambda x: x.lower().strip())
+                    df[col] = df[col].str.lower().str.strip()
                 
-                # Normalize websites
+                # Normalize websites by adding https if missing
                 if col == 'Website':
-                    df[col] = df[col].apply(lambda x: normalize_url(x))
+                    missing_scheme = (df[col] != '') & ~df[col].str.startswith(('http://', 'https://'))
+                    df[col] = df[col].mask(missing_scheme, 'https://' + df[col])
         
         # Create a composite key for duplicate detection (improved address normalization)
-        df['composite_key'] = df.apply(lambda row: create_business_hash(
-            row['Business Name'], 
-            row['Address'], 
-            row['Phone Number']
-        ), axis=1)
+        df['composite_key'] = pd.util.hash_pandas_object(
+            business_hash_keys(df['Business Name'], df['Address'], df['Phone Number']),
+            index=False,
+        )
         
         # Remove duplicates based on composite key
         initial_count = len(df)
@@ -2090,125 +2922,119 @@ def export_to_excel(data, filename):
         df = df.drop('composite_key', axis=1)
         
         # Add social media completeness metrics
-        social_platforms = ['Facebook', 'Instagram', 'Twitter', 'LinkedIn', 'YouTube', 'TikTok', 'Yelp', 'WhatsApp', 'Pinterest']
+        social_platforms = [platform for platform in SOCIAL_PLATFORMS if platform in present_columns]
         
         # Count social platforms per business
-        df['Social_Count'] = df[social_platforms].apply(lambda row: sum(1 for x in row if x != ""), axis=1)
+        df['Social_Count'] = df[social_platforms].ne('').sum(axis=1)
         
-        # Export to Excel
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Remove analysis columns before exporting
-            export_df = df.drop('Social_Count', axis=1)
-            export_df.to_excel(writer, index=False, sheet_name='Businesses')
-            
-            # Create summary sheet
-            summary_data = {
-                'Metric': [
-                    'Total Businesses', 
-                    'Duplicates Removed',
-                    'Businesses with Email',
-                    'Businesses with Website',
-                    'Businesses with 0 Social Platforms',
-                    'Businesses with 1-3 Social Platforms',
-                    'Businesses with 4-6 Social Platforms',
-                    'Businesses with 7+ Social Platforms',
-                    'Average Social Platforms per Business'
-                ],
-                'Value': [
-                    len(df),
-                    removed_count,
-                    len(df[df['Email'] != ""]),
-                    len(df[df['Website'] != ""]),
-                    len(df[df['Social_Count'] == 0]),
-                    len(df[(df['Social_Count'] >= 1) & (df['Social_Count'] <= 3)]),
-                    len(df[(df['Social_Count'] >= 4) & (df['Social_Count'] <= 6)]),
-                    len(df[df['Social_Count'] >= 7]),
-                    df['Social_Count'].mean()
-                ],
-                'Percentage': [
-                    '100%',
-                    f"{removed_count/initial_count:.1%}" if initial_count > 0 else "0%",
-                    f"{len(df[df['Email'] != ''])/len(df):.1%}" if len(df) > 0 else "0%",
-                    f"{len(df[df['Website'] != ''])/len(df):.1%}" if len(df) > 0 else "0%",
-                    f"{len(df[df['Social_Count'] == 0])/len(df):.1%}" if len(df) > 0 else "0%",
-                    f"{len(df[(df['Social_Count'] >= 1) & (df['Social_Count'] <= 3)])/len(df):.1%}" if len(df) > 0 else "0%",
-                    f"{len(df[(df['Social_Count'] >= 4) & (df['Social_Count'] <= 6)])/len(df):.1%}" if len(df) > 0 else "0%",
-                    f"{len(df[df['Social_Count'] >= 7])/len(df):.1%}" if len(df) > 0 else "0%",
-                    "N/A"
-                ]
-            }
-            
-            # Platform-specific stats
-            for platform in social_platforms:
-                if platform in df.columns:
-                    platform_count = len(df[df[platform] != ""])
-                    summary_data['Metric'].append(f'Businesses with {platform}')
-                    summary_data['Value'].append(platform_count)
-                    summary_data['Percentage'].append(f"{platform_count/len(df):.1%}" if len(df) > 0 else "0%")
-            
-            # Create summary dataframe and export
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, index=False, sheet_name='Summary')
-            
-            # Get the workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Businesses']
-            summary_worksheet = writer.sheets['Summary']
-            
-            # Auto-adjust column widths for main sheet
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-            # Format summary sheet
-            for column in summary_worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 30)
-                summary_worksheet.column_dimensions[column_letter].width = adjusted_width
+        # Businesses with each contact field in one reduction, shared by the summary sheet and the console report
+        nonempty = df[['Email', 'Website', *social_platforms]].ne('').sum()
+        email_count = int(nonempty['Email'])
+        website_count = int(nonempty['Website'])
+        platform_counts = {platform: int(nonempty[platform]) for platform in social_platforms}
+        social_count = int(nonempty[social_platforms].sum())
         
-        print(f'Enhanced export complete: {len(df)} businesses to {filename}')
+        # Social platform distribution, counted by reduction instead of filtering rows
+        no_social_count = int(df['Social_Count'].eq(0).sum())
+        few_social_count = int(df['Social_Count'].between(1, 3).sum())
+        some_social_count = int(df['Social_Count'].between(4, 6).sum())
+        many_social_count = int(df['Social_Count'].ge(7).sum())
+        average_social_count = df['Social_Count'].mean()
+        
+        # Export to Excel with a write-only workbook, rows are streamed instead of kept as cell objects
+        workbook = Workbook(write_only=True)
         
-        # Print summary statistics
-        print(f'\n=== EXTRACTION SUMMARY ===')
-        print(f'Total unique businesses: {len(df)}')
-        print(f'Duplicates removed: {removed_count}')
-        print(f'Businesses with emails: {len(df[df["Email"] != ""])}')
-        print(f'Businesses with websites: {len(df[df["Website"] != ""])}')
+        # Analysis columns are left out of the export
+        export_columns = [col for col in df.columns if col != 'Social_Count']
+        write_sheet(workbook, 'Businesses', sheet_columns(df, export_columns), max_width=50)  # Cap at 50 characters
         
-        # Social media statistics
-        for platform in social_platforms:
-            if platform in df.columns:
-                count = len(df[df[platform] != ""])
-                print(f'Businesses with {platform}: {count} ({count/len(df):.1%})')
+        # Create summary sheet
+        summary_data = {
+            'Metric': [
+                'Total Businesses', 
+                'Duplicates Removed',
+                'Businesses with Email',
+                'Businesses with Website',
+                'Businesses with 0 Social Platforms',
+                'Businesses with 1-3 Social Platforms',
+                'Businesses with 4-6 Social Platforms',
+                'Businesses with 7+ Social Platforms',
+                'Average Social Platforms per Business'
+            ],
+            'Value': [
+                len(df),
+                removed_count,
+                email_count,
+                website_count,
+                no_social_count,
+                few_social_count,
+                some_social_count,
+                many_social_count,
+                average_social_count
+            ],
+            'Percentage': [
+                '100%',
+                f"{removed_count/initial_count:.1%}" if initial_count > 0 else "0%",
+                f"{email_count/len(df):.1%}" if len(df) > 0 else "0%",
+                f"{website_count/len(df):.1%}" if len(df) > 0 else "0%",
+                f"{no_social_count/len(df):.1%}" if len(df) > 0 else "0%",
+                f"{few_social_count/len(df):.1%}" if len(df) > 0 else "0%",
+                f"{some_social_count/len(df):.1%}" if len(df) > 0 else "0%",
+                f"{many_social_count/len(df):.1%}" if len(df) > 0 else "0%",
+                "N/A"
+            ]
+        }
         
-        # Social count distribution
-        print(f'\nSocial platform distribution:')
-        print(f'0 platforms: {len(df[df["Social_Count"] == 0])} ({len(df[df["Social_Count"] == 0])/len(df):.1%})')
-        print(f'1-3 platforms: {len(df[(df["Social_Count"] >= 1) & (df["Social_Count"] <= 3)])} ({len(df[(df["Social_Count"] >= 1) & (df["Social_Count"] <= 3)])/len(df):.1%})')
-        print(f'4-6 platforms: {len(df[(df["Social_Count"] >= 4) & (df["Social_Count"] <= 6)])} ({len(df[(df["Social_Count"] >= 4) & (df["Social_Count"] <= 6)])/len(df):.1%})')
-        print(f'7+ platforms: {len(df[df["Social_Count"] >= 7])} ({len(df[df["Social_Count"] >= 7])/len(df):.1%})')
-        print(f'Average platforms per business: {df["Social_Count"].mean():.1f}')
+        # Platform-specific stats
+        for platform, platform_count in platform_counts.items():
+            summary_data['Metric'].append(f'Businesses with {platform}')
+            summary_data['Value'].append(platform_count)
+            summary_data['Percentage'].append(f"{platform_count/len(df):.1%}" if len(df) > 0 else "0%")
+        
+        # The summary is already laid out as columns, write it without a DataFrame
+        write_sheet(workbook, 'Summary', summary_data, max_width=30)
+        workbook.save(filename)
+        
+        print(f'Enhanced export complete: {len(df)} businesses to {filename}')
+        
+        # Print summary statistics in one write
+        summary_lines = [
+            '',
+            '=== EXTRACTION SUMMARY ===',
+            f'Total unique businesses: {len(df)}',
+            f'Duplicates removed: {removed_count}',
+            f'Businesses with emails: {email_count}',
+            f'Businesses with websites: {website_count}',
+            # Social media statistics
+            *(f'Businesses with {platform}: {count} ({count/len(df):.1%})' for platform, count in platform_counts.items()),
+            # Social count distribution
+            '',
+            'Social platform distribution:',
+            f'0 platforms: {no_social_count} ({no_social_count/len(df):.1%})',
+            f'1-3 platforms: {few_social_count} ({few_social_count/len(df):.1%})',
+            f'4-6 platforms: {some_social_count} ({some_social_count/len(df):.1%})',
+            f'7+ platforms: {many_social_count} ({many_social_count/len(df):.1%})',
+            f'Average platforms per business: {average_social_count:.1f}',
+        ]
+        print('\n'.join(summary_lines))
+        return {
+            'total': len(df),
+            'emails': email_count,
+            'websites': website_count,
+            'social': social_count,
+            'per_platform': platform_counts,
+        }
     except Exception as e:
         print(f'Error exporting to Excel: {e}')
 
 if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(message)s',
+        handlers=[logging.FileHandler(LOG_FILE, encoding='utf-8'), logging.StreamHandler()],
+    )
     print("=== Enhanced Google Maps Business Scraper v2.0 ===")
     print("Features: Advanced social media extraction, robust email detection, website crawling")
-    print("Supported platforms: Facebook, Instagram, Twitter, LinkedIn, YouTube, TikTok, Yelp, WhatsApp, Pinterest")
+    print(f"Supported platforms: {', '.join(SOCIAL_PLATFORMS)}")
     print("=" * 80)
     launch_ui()
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# main.py imports the scraper's browser and HTTP stack at module load
+pytest.importorskip('playwright')
+pytest.importorskip('httpx')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import RobustSocialExtractor  # noqa: E402
+
+
+def found(text):
+    return {platform: url for platform, url in RobustSocialExtractor.extract_social_from_text(text).items() if url}
+
+
+# Expected output recorded from the original per-pattern extractor
+@pytest.mark.parametrize('text, expected', [
+    # Scheme-less suffixes inside a longer URL must not become profile URLs
+    ('Review us at https://www.yelp.com/writeareview/biz/joes-cafe today', {}),
+    ('Search for us at https://yelp.com/search please', {}),
+    ('Find us at https://www.yelp.com/biz/joes-cafe and https://m.facebook.com/joes.cafe', {
+        'Facebook': 'https://m.facebook.com/joes.cafe',
+        'Yelp': 'https://www.yelp.com/biz/joes-cafe',
+    }),
+])
+def test_matches_original_extractor(text, expected):
+    assert found(text) == expected